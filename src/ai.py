@@ -4,8 +4,39 @@ Implements AI opponent using Minimax algorithm with Alpha-Beta pruning.
 """
 
 import random
-from typing import List, Tuple, Optional
-from .game_logic import QuoridorGame, GameState, Player, Wall, WallOrientation
+import time
+from typing import Dict, List, Tuple, Optional
+from .constants import BOARD_SIZE
+from .game_logic import (
+    QuoridorGame, Player, Wall,
+    GOAL_ROW, WALL_GRID_SIZE, WALL_ID_VERTICAL, wall_from_id
+)
+
+
+def _build_window_masks() -> List[int]:
+    """
+    Build, for every board cell, a wall bitboard covering the wall slots
+    within 2 rows/columns of that cell (the strategic wall search window).
+    """
+    masks = []
+    for row in range(BOARD_SIZE):
+        for col in range(BOARD_SIZE):
+            mask = 0
+            for r in range(max(0, row - 2), min(WALL_GRID_SIZE, row + 3)):
+                for c in range(max(0, col - 2), min(WALL_GRID_SIZE, col + 3)):
+                    mask |= 1 << (r * WALL_GRID_SIZE + c)
+            masks.append(mask)
+    return masks
+
+
+WALL_WINDOW_MASKS = _build_window_masks()
+
+
+class TTFlag:
+    """Enum-like class for transposition table bound types"""
+    EXACT = 0
+    LOWER = 1  # Stored value is a lower bound (search failed high)
+    UPPER = 2  # Stored value is an upper bound (search failed low)
 
 
 class QuoridorAI:
@@ -33,6 +64,21 @@ class QuoridorAI:
             'center_control': 1.0,
             'wall_blocking': 3.0
         }
+        
+        # Transposition table: Zobrist hash -> (depth, value, flag, best_move),
+        # with value from the point of view of the side to move
+        self.tt: Dict[int, Tuple[int, float, int, Optional[Tuple[int, int]]]] = {}
+        
+        # Shortest path lengths for the current search, keyed by an int packing
+        # (walls hash, cell index, player) - see _shortest_path
+        self._path_cache: Dict[int, int] = {}
+        
+        # Soft time budget (seconds) for iterative deepening
+        self.time_budget = 2.0
+        
+        # Root walls that change the combined path lengths by at least this much
+        # are searched one ply past the horizon (quiescence extension)
+        self.quiescence_swing = 2
     
     def _get_depth_for_difficulty(self, difficulty: str) -> int:
         """Get search depth based on difficulty"""
@@ -52,6 +98,9 @@ class QuoridorAI:
             - move_type is "move" or "wall"
             - move_data is position tuple or Wall object
         """
+        self.tt.clear()
+        self._path_cache.clear()
+        
         if self.difficulty == "easy":
             return self._get_easy_move(game)
         else:
@@ -66,7 +115,7 @@ class QuoridorAI:
             # Find move that gets closest to goal
             best_move = None
             best_distance = float('inf')
-            goal_row = 0 if self.player == Player.PLAYER1 else game.state.board_size - 1
+            goal_row = GOAL_ROW[self.player]
             
             for move in valid_moves:
                 dist = abs(move[0] - goal_row)
@@ -89,96 +138,156 @@ class QuoridorAI:
             return ("move", random.choice(valid_moves))
     
     def _get_minimax_move(self, game: QuoridorGame) -> Tuple[str, any]:
-        """Get best move using Minimax with Alpha-Beta pruning"""
-        best_score = float('-inf')
-        best_move = None
-        alpha = float('-inf')
-        beta = float('inf')
+        """
+        Get best move using iterative deepening Minimax with Alpha-Beta pruning.
+        Each iteration searches the previous iteration's best action first and
+        orders the remaining actions by their previous scores.
+        """
+        # Search on a private clone: the whole search runs make/unmake on it,
+        # so the caller's game never sees intermediate positions
+        game = game.copy()
         
         # Get all possible actions
         moves = game.get_valid_moves()
         walls = self._get_strategic_walls(game) if game.state.get_current_player_walls() > 0 else []
+        actions = [("move", move) for move in moves] + [("wall", wall) for wall in walls]
         
-        # Evaluate all moves
-        for move in moves:
-            game_copy = QuoridorGame()
-            game_copy.state = game.state.copy()
-            game_copy.move_player(move)
+        best_move = ("move", moves[0])
+        start_time = time.monotonic()
+        
+        for depth in range(1, self.max_depth + 1):
+            best_move, scores = self._search_root(game, actions, depth)
+            
+            # Principal variation first, then by score from this iteration
+            actions.sort(key=lambda action: scores[action], reverse=True)
+            
+            # Skip the next (much deeper) iteration if this one used half the budget
+            if time.monotonic() - start_time > self.time_budget * 0.5:
+                break
+        
+        return best_move
+    
+    def _search_root(self, game: QuoridorGame, actions: List[Tuple[str, any]],
+                     depth: int) -> Tuple[Tuple[str, any], dict]:
+        """Search all root actions to the given depth, returning the best one and all scores"""
+        best_score = float('-inf')
+        best_move = actions[0]
+        alpha = float('-inf')
+        beta = float('inf')
+        scores = {}
+        
+        for action in actions:
+            extend = False
+            if action[0] == "move":
+                undo = game.push(action)
+            else:
+                ai_before, opponent_before = self._path_lengths(game)
+                undo = game.push(action)
+                ai_after, opponent_after = self._path_lengths(game)
+                swing = abs(ai_after - ai_before) + abs(opponent_after - opponent_before)
+                extend = swing >= self.quiescence_swing
             
-            score = self._minimax(game_copy, self.max_depth - 1, alpha, beta, False)
+            # The opponent moves next, so its negamax score is negated
+            score = -self._negamax(game, depth - 1, -beta, -alpha, -1, extend)
+            game.pop(undo)
+            scores[action] = score
             
             if score > best_score:
                 best_score = score
-                best_move = ("move", move)
+                best_move = action
             
             alpha = max(alpha, score)
         
-        # Evaluate wall placements
-        for wall in walls:
-            game_copy = QuoridorGame()
-            game_copy.state = game.state.copy()
-            
-            if game_copy.can_place_wall(wall):
-                game_copy.place_wall(wall)
-                score = self._minimax(game_copy, self.max_depth - 1, alpha, beta, False)
-                
-                if score > best_score:
-                    best_score = score
-                    best_move = ("wall", wall)
-                
-                alpha = max(alpha, score)
-        
-        # Fallback to first valid move
-        if best_move is None:
-            best_move = ("move", moves[0])
-        
-        return best_move
+        return best_move, scores
     
-    def _minimax(self, game: QuoridorGame, depth: int, alpha: float, beta: float, 
-                 is_maximizing: bool) -> float:
-        """Minimax algorithm with alpha-beta pruning"""
+    def _negamax(self, game: QuoridorGame, depth: int, alpha: float, beta: float,
+                 color: int, extend: bool = False) -> float:
+        """
+        Minimax with alpha-beta pruning in negamax form: scores are from the point
+        of view of the side to move, with color 1 when that is the AI and -1 when
+        it is the opponent. One loop serves both sides instead of mirrored
+        max/min branches, and TT entries are stored in the mover's perspective.
+        If extend is set (the whole subtree under a root wall that swung the
+        paths), positions at the horizon are searched one more ply instead of
+        being evaluated statically (quiescence).
+        """
+        state = game.state
+        
         # Terminal conditions
-        if game.state.game_over:
-            if game.state.winner == self.player:
-                return 1000 + depth  # Win sooner is better
+        if state.game_over:
+            if state.winner == self.player:
+                return color * (1000 + depth)  # Win sooner is better
+            return color * (-1000 - depth)  # Lose later is better
+        
+        # A wall that just swung the path race is not quiet: let the replies play
+        # out, one ply only, so the extension itself is not extended again
+        if depth == 0 and extend:
+            depth = 1
+            extend = False
+        
+        # Transposition table probe
+        key = state.zobrist
+        entry = self.tt.get(key)
+        if entry is not None and entry[0] >= depth:
+            _, value, flag, _ = entry
+            if flag == TTFlag.EXACT:
+                return value
+            if flag == TTFlag.LOWER:
+                alpha = max(alpha, value)
             else:
-                return -1000 - depth  # Lose later is better
+                beta = min(beta, value)
+            if alpha >= beta:
+                return value
         
         if depth == 0:
-            return self._evaluate(game)
+            value = color * self._evaluate(game)
+            self.tt[key] = (0, value, TTFlag.EXACT, None)
+            return value
         
-        if is_maximizing:
-            max_eval = float('-inf')
-            
-            for move in game.get_valid_moves():
-                game_copy = QuoridorGame()
-                game_copy.state = game.state.copy()
-                game_copy.move_player(move)
-                
-                eval_score = self._minimax(game_copy, depth - 1, alpha, beta, False)
-                max_eval = max(max_eval, eval_score)
-                alpha = max(alpha, eval_score)
-                
-                if beta <= alpha:
-                    break
-            
-            return max_eval
+        alpha_orig = alpha
+        moves = self._order_moves(game, game.get_valid_moves(), entry[3] if entry else None)
+        best = float('-inf')
+        best_move = None
+        push, pop = game.push, game.pop
+        
+        for move in moves:
+            undo = push(("move", move))
+            score = -self._negamax(game, depth - 1, -beta, -alpha, -color, extend)
+            pop(undo)
+            if score > best:
+                best = score
+                best_move = move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+        
+        # Transposition table store
+        if best <= alpha_orig:
+            flag = TTFlag.UPPER
+        elif best >= beta:
+            flag = TTFlag.LOWER
         else:
-            min_eval = float('inf')
-            
-            for move in game.get_valid_moves():
-                game_copy = QuoridorGame()
-                game_copy.state = game.state.copy()
-                game_copy.move_player(move)
-                
-                eval_score = self._minimax(game_copy, depth - 1, alpha, beta, True)
-                min_eval = min(min_eval, eval_score)
-                beta = min(beta, eval_score)
-                
-                if beta <= alpha:
-                    break
-            
-            return min_eval
+            flag = TTFlag.EXACT
+        self.tt[key] = (depth, best, flag, best_move)
+        
+        return best
+    
+    def _order_moves(self, game: QuoridorGame, moves: List[Tuple[int, int]],
+                     tt_move: Optional[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """
+        Order pawn moves for better alpha-beta pruning.
+        The best move from a previous search of this position goes first,
+        followed by the moves that bring the mover closest to its goal row.
+        """
+        goal_row = GOAL_ROW[game.state.current_player]
+        moves.sort(key=lambda move: abs(move[0] - goal_row))
+        
+        if tt_move is not None and tt_move in moves:
+            moves.remove(tt_move)
+            moves.insert(0, tt_move)
+        
+        return moves
     
     def _evaluate(self, game: QuoridorGame) -> float:
         """
@@ -188,14 +297,7 @@ class QuoridorAI:
         state = game.state
         
         # Path length difference (shorter is better for AI)
-        ai_path = game.get_shortest_path_length(
-            state.player1_pos if self.player == Player.PLAYER1 else state.player2_pos,
-            self.player
-        )
-        opponent_path = game.get_shortest_path_length(
-            state.player2_pos if self.player == Player.PLAYER1 else state.player1_pos,
-            Player.PLAYER2 if self.player == Player.PLAYER1 else Player.PLAYER1
-        )
+        ai_path, opponent_path = self._path_lengths(game)
         
         path_score = (opponent_path - ai_path) * self.weights['path_difference']
         
@@ -218,6 +320,30 @@ class QuoridorAI:
         
         return path_score + wall_score + center_score + progress
     
+    def _path_lengths(self, game: QuoridorGame) -> Tuple[int, int]:
+        """Get the (AI, opponent) shortest path lengths to their goal rows"""
+        state = game.state
+        p1_path = self._shortest_path(game, self._idx(state.player1_pos), Player.PLAYER1)
+        p2_path = self._shortest_path(game, self._idx(state.player2_pos), Player.PLAYER2)
+        if self.player == Player.PLAYER1:
+            return p1_path, p2_path
+        return p2_path, p1_path
+    
+    @staticmethod
+    def _idx(pos: Tuple[int, int]) -> int:
+        """Convert a (row, col) position to a flat cell index"""
+        return pos[0] * BOARD_SIZE + pos[1]
+    
+    def _shortest_path(self, game: QuoridorGame, cell: int, player: Player) -> int:
+        """Get shortest path length to goal, memoized for the duration of one search"""
+        # Cell indices fit in 7 bits, so one int key replaces a nested tuple key
+        key = (game.state.walls_hash << 8) | (cell << 1) | (player == Player.PLAYER2)
+        length = self._path_cache.get(key)
+        if length is None:
+            length = game.get_cell_path_length(cell, player)
+            self._path_cache[key] = length
+        return length
+    
     def _get_strategic_walls(self, game: QuoridorGame) -> List[Wall]:
         """
         Get a filtered list of strategic wall placements.
@@ -231,22 +357,43 @@ class QuoridorAI:
         opponent_pos = state.player2_pos if self.player == Player.PLAYER1 else state.player1_pos
         op_row, op_col = opponent_pos
         
-        # Focus on walls near opponent's position and along their path
-        for dr in range(-2, 3):
-            for dc in range(-2, 3):
-                row = op_row + dr
-                col = op_col + dc
-                
-                if 0 <= row < state.board_size - 1 and 0 <= col < state.board_size - 1:
-                    # Try both orientations
-                    for orientation in WallOrientation:
-                        wall = Wall(row, col, orientation)
-                        if game.can_place_wall(wall):
-                            strategic_walls.append(wall)
-        
-        # Limit total walls considered for performance
+        # Focus on walls near opponent's position: intersect the search window
+        # with the slots not already blocked by placed walls
+        window = WALL_WINDOW_MASKS[op_row * BOARD_SIZE + op_col]
+        open_h, open_v = state.get_open_wall_slots()
+        open_h &= window
+        open_v &= window
+        
+        # Visit candidate slots in row-major order, lowest bit first
+        candidates = open_h | open_v
+        while candidates:
+            low_bit = candidates & -candidates
+            candidates ^= low_bit
+            index = low_bit.bit_length() - 1
+            
+            # Only surviving candidates need the (BFS) path check. Walls come
+            # from the shared per-id table rather than being constructed here.
+            if open_h & low_bit:
+                wall = wall_from_id(index)
+                if game.keeps_paths_open(wall):
+                    strategic_walls.append(wall)
+            if open_v & low_bit:
+                wall = wall_from_id(index + WALL_ID_VERTICAL)
+                if game.keeps_paths_open(wall):
+                    strategic_walls.append(wall)
+        
+        # Limit total walls considered for performance, keeping the walls
+        # closest to the opponent's shortest path. The sort is stable, so ties
+        # keep row-major order and the list depends only on the position.
         if len(strategic_walls) > 20:
-            strategic_walls = random.sample(strategic_walls, 20)
+            opponent = Player.PLAYER2 if self.player == Player.PLAYER1 else Player.PLAYER1
+            path_mask = game.get_shortest_path_mask(opponent)
+            path = [divmod(cell, BOARD_SIZE) for cell in range(BOARD_SIZE * BOARD_SIZE) if (path_mask >> cell) & 1]
+            # Chebyshev distance from the wall midpoint (row + 0.5, col + 0.5), doubled
+            strategic_walls.sort(key=lambda wall: min(
+                max(abs(2 * (r - wall.row) - 1), abs(2 * (c - wall.col) - 1)) for r, c in path
+            ))
+            strategic_walls = strategic_walls[:20]
         
         return strategic_walls
 
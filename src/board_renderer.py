@@ -5,7 +5,7 @@ Handles all board rendering with modern visuals and animations.
 
 import pygame
 import math
-from typing import Tuple, Optional, List, Set
+from typing import Iterable, Tuple, Optional, List
 from .constants import (
     COLORS, CELL_SIZE, WALL_THICKNESS, BOARD_SIZE,
     ANIMATION_SPEED, CARD_BORDER_RADIUS
@@ -13,6 +13,13 @@ from .constants import (
 from .game_logic import Wall, WallOrientation, Player
 
 
+def _to_display_format(surface: pygame.Surface) -> pygame.Surface:
+    """Convert a cached surface to the display's pixel format once a window exists"""
+    if pygame.display.get_surface() is not None:
+        return surface.convert_alpha()
+    return surface
+
+
 class BoardRenderer:
     """Handles rendering of the game board with modern effects"""
     
@@ -41,6 +48,17 @@ class BoardRenderer:
         # Calculate board dimensions
         self.board_width = self.board_size * self.cell_size + (self.board_size - 1) * self.wall_thickness
         self.board_height = self.board_width
+        
+        # Squared hit radius around wall intersections (avoids sqrt in hit-testing)
+        self._wall_hit_r2 = (self.cell_size * 0.8) ** 2
+        
+        # Static board background, rebuilt when the board geometry changes
+        self._board_bg_cache: Optional[pygame.Surface] = None
+        self._board_bg_key: Optional[Tuple[int, int, int]] = None
+        
+        # Pre-rendered effect surfaces (glows, highlights, shadows), keyed by style.
+        # Built lazily on first draw so they can be converted to the display format.
+        self._glow_cache: dict = {}
     
     def update(self, dt: float, player1_pos: Tuple[int, int], player2_pos: Tuple[int, int]):
         """Update animations"""
@@ -78,37 +96,49 @@ class BoardRenderer:
     
     def draw_board(self, screen: pygame.Surface):
         """Draw the game board background and cells"""
+        # The container, cells and wall slots only change with the board geometry
+        cache_key = (self.offset_x, self.offset_y, self.cell_size)
+        if self._board_bg_cache is None or self._board_bg_key != cache_key:
+            self._rebuild_static()
+            self._board_bg_key = cache_key
+        screen.blit(self._board_bg_cache, (self.offset_x - 25, self.offset_y - 25))
+        
+        # Only hovered cells differ from the cached background
+        for (row, col), hover_amount in self.hover_progress.items():
+            if hover_amount > 0:
+                x, y = self._cell_to_screen(row, col)
+                self._draw_cell(screen, x, y, row, col, hover_amount)
+    
+    def _rebuild_static(self):
+        """Render the board container, resting cells and wall slots into a cached surface"""
+        origin_x = self.offset_x - 25
+        origin_y = self.offset_y - 25
+        cache = pygame.Surface((self.board_width + 50, self.board_height + 50), pygame.SRCALPHA)
+        
         # Draw board container with shadow
-        container_rect = pygame.Rect(
-            self.offset_x - 15,
-            self.offset_y - 15,
-            self.board_width + 30,
-            self.board_height + 30
-        )
+        container_rect = pygame.Rect(10, 10, self.board_width + 30, self.board_height + 30)
         
         # Shadow
-        shadow_surface = pygame.Surface((container_rect.width + 20, container_rect.height + 20), pygame.SRCALPHA)
-        pygame.draw.rect(shadow_surface, (0, 0, 0, 50),
-                        (10, 10, container_rect.width, container_rect.height),
+        pygame.draw.rect(cache, (0, 0, 0, 50), container_rect,
                         border_radius=CARD_BORDER_RADIUS + 5)
-        screen.blit(shadow_surface, (container_rect.x - 10, container_rect.y - 10))
         
         # Main container
-        pygame.draw.rect(screen, COLORS.BOARD_BG, container_rect, border_radius=CARD_BORDER_RADIUS)
-        pygame.draw.rect(screen, COLORS.TEXT_MUTED, container_rect, width=1, border_radius=CARD_BORDER_RADIUS)
+        pygame.draw.rect(cache, COLORS.BOARD_BG, container_rect, border_radius=CARD_BORDER_RADIUS)
+        pygame.draw.rect(cache, COLORS.TEXT_MUTED, container_rect, width=1, border_radius=CARD_BORDER_RADIUS)
         
         # Draw cells
         for row in range(self.board_size):
             for col in range(self.board_size):
-                self._draw_cell(screen, row, col)
+                x, y = self._cell_to_screen(row, col)
+                self._draw_cell(cache, x - origin_x, y - origin_y, row, col, 0.0)
         
         # Draw wall slots
-        self._draw_wall_slots(screen)
-    
-    def _draw_cell(self, screen: pygame.Surface, row: int, col: int):
-        """Draw a single cell"""
-        x, y = self._cell_to_screen(row, col)
+        self._draw_wall_slots(cache, origin_x, origin_y)
         
+        self._board_bg_cache = _to_display_format(cache)
+    
+    def _draw_cell(self, screen: pygame.Surface, x: int, y: int, row: int, col: int, hover_amount: float):
+        """Draw a single cell with its top-left corner at (x, y)"""
         # Determine base color
         is_goal_p1 = row == 0
         is_goal_p2 = row == self.board_size - 1
@@ -119,7 +149,6 @@ class BoardRenderer:
             base_color = COLORS.CELL_DARK
         
         # Apply hover effect
-        hover_amount = self.hover_progress.get((row, col), 0.0)
         if hover_amount > 0:
             color = self._lerp_color(base_color, COLORS.CELL_HOVER, hover_amount)
         else:
@@ -137,30 +166,35 @@ class BoardRenderer:
     
     def _draw_goal_highlight(self, screen: pygame.Surface, x: int, y: int, color: Tuple[int, int, int]):
         """Draw goal row highlight"""
-        highlight_surface = pygame.Surface((self.cell_size, self.cell_size), pygame.SRCALPHA)
-        
-        # Gradient effect
-        for i in range(self.cell_size // 2):
-            alpha = int(30 * (1 - i / (self.cell_size // 2)))
-            pygame.draw.rect(highlight_surface, (*color, alpha),
-                           (i, i, self.cell_size - 2*i, self.cell_size - 2*i),
-                           border_radius=max(1, 6 - i))
+        key = ('goal', color, self.cell_size)
+        highlight_surface = self._glow_cache.get(key)
+        if highlight_surface is None:
+            highlight_surface = pygame.Surface((self.cell_size, self.cell_size), pygame.SRCALPHA)
+            
+            # Gradient effect
+            for i in range(self.cell_size // 2):
+                alpha = int(30 * (1 - i / (self.cell_size // 2)))
+                pygame.draw.rect(highlight_surface, (*color, alpha),
+                               (i, i, self.cell_size - 2*i, self.cell_size - 2*i),
+                               border_radius=max(1, 6 - i))
+            highlight_surface = _to_display_format(highlight_surface)
+            self._glow_cache[key] = highlight_surface
         
         screen.blit(highlight_surface, (x, y))
     
-    def _draw_wall_slots(self, screen: pygame.Surface):
-        """Draw wall placement slots"""
+    def _draw_wall_slots(self, screen: pygame.Surface, origin_x: int = 0, origin_y: int = 0):
+        """Draw wall placement slots onto a surface whose top-left is at (origin_x, origin_y)"""
         for row in range(self.board_size - 1):
             for col in range(self.board_size - 1):
                 # Intersection point
-                ix = self.offset_x + (col + 1) * self.cell_size + col * self.wall_thickness
-                iy = self.offset_y + (row + 1) * self.cell_size + row * self.wall_thickness
+                ix = self.offset_x - origin_x + (col + 1) * self.cell_size + col * self.wall_thickness
+                iy = self.offset_y - origin_y + (row + 1) * self.cell_size + row * self.wall_thickness
                 
                 pygame.draw.rect(screen, COLORS.WALL_SLOT,
                                (ix, iy, self.wall_thickness, self.wall_thickness),
                                border_radius=2)
     
-    def draw_walls(self, screen: pygame.Surface, walls: Set[Wall]):
+    def draw_walls(self, screen: pygame.Surface, walls: Iterable[Wall]):
         """Draw placed walls"""
         for wall in walls:
             self._draw_wall(screen, wall, COLORS.WALL_PLACED)
@@ -193,15 +227,25 @@ class BoardRenderer:
             height = 2 * self.cell_size + self.wall_thickness
         
         if alpha < 255:
-            wall_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-            pygame.draw.rect(wall_surface, (*color, alpha),
-                           (0, 0, width, height), border_radius=4)
+            key = ('wall', color, alpha, width, height)
+            wall_surface = self._glow_cache.get(key)
+            if wall_surface is None:
+                wall_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+                pygame.draw.rect(wall_surface, (*color, alpha),
+                               (0, 0, width, height), border_radius=4)
+                wall_surface = _to_display_format(wall_surface)
+                self._glow_cache[key] = wall_surface
             screen.blit(wall_surface, (x, y))
         else:
             # Draw shadow
-            shadow_surface = pygame.Surface((width + 4, height + 4), pygame.SRCALPHA)
-            pygame.draw.rect(shadow_surface, (0, 0, 0, 40),
-                           (2, 2, width, height), border_radius=4)
+            key = ('wall_shadow', width, height)
+            shadow_surface = self._glow_cache.get(key)
+            if shadow_surface is None:
+                shadow_surface = pygame.Surface((width + 4, height + 4), pygame.SRCALPHA)
+                pygame.draw.rect(shadow_surface, (0, 0, 0, 40),
+                               (2, 2, width, height), border_radius=4)
+                shadow_surface = _to_display_format(shadow_surface)
+                self._glow_cache[key] = shadow_surface
             screen.blit(shadow_surface, (x - 2, y - 2))
             
             # Draw wall
@@ -231,29 +275,37 @@ class BoardRenderer:
             min(255, base_color[2] + 60)
         )
         
-        for row, col in valid_moves:
-            x, y = self._cell_to_screen(row, col)
-            center_x = x + self.cell_size // 2
-            center_y = y + self.cell_size // 2
-            
-            # Pulsing animation
-            pulse = (math.sin(self.animation_time * ANIMATION_SPEED) + 1) / 2
-            radius = int(10 + pulse * 4)
-            alpha = int(80 + pulse * 50)  # Lower opacity (80-130 range)
+        # Pulsing animation
+        pulse = (math.sin(self.animation_time * ANIMATION_SPEED) + 1) / 2
+        radius = int(10 + pulse * 4)
+        alpha = int(80 + pulse * 50)  # Lower opacity (80-130 range)
+        
+        # One pre-rendered gradient per color and radius; the pulse opacity is
+        # applied as surface alpha so every indicator shares the same surface
+        glow_surface = self._get_move_indicator(light_color, radius)
+        glow_surface.set_alpha(alpha)
+        
+        screen.blits([(glow_surface, self._cell_to_screen(row, col)) for row, col in valid_moves],
+                     doreturn=False)
+    
+    def _get_move_indicator(self, light_color: Tuple[int, int, int], radius: int) -> pygame.Surface:
+        """Get the cached stepped radial gradient used for valid-move indicators"""
+        key = ('move', light_color, radius, self.cell_size)
+        glow_surface = self._glow_cache.get(key)
+        if glow_surface is None:
+            glow_surface = pygame.Surface((self.cell_size, self.cell_size), pygame.SRCALPHA)
+            center = (self.cell_size // 2, self.cell_size // 2)
             
             # Draw glow
-            glow_surface = pygame.Surface((self.cell_size, self.cell_size), pygame.SRCALPHA)
             for i in range(3):
                 glow_radius = radius + (3 - i) * 4
-                glow_alpha = alpha // (i + 2)
-                pygame.draw.circle(glow_surface, (*light_color, glow_alpha),
-                                 (self.cell_size // 2, self.cell_size // 2), glow_radius)
+                pygame.draw.circle(glow_surface, (*light_color, 255 // (i + 2)), center, glow_radius)
             
             # Draw main indicator
-            pygame.draw.circle(glow_surface, (*light_color, alpha),
-                             (self.cell_size // 2, self.cell_size // 2), radius)
-            
-            screen.blit(glow_surface, (x, y))
+            pygame.draw.circle(glow_surface, (*light_color, 255), center, radius)
+            glow_surface = _to_display_format(glow_surface)
+            self._glow_cache[key] = glow_surface
+        return glow_surface
     
     def draw_pawns(self, screen: pygame.Surface, current_player: Player):
         """Draw player pawns with glow effect for current player"""
@@ -281,18 +333,21 @@ class BoardRenderer:
         # Draw glow effect for current player
         if glow:
             pulse = (math.sin(self.animation_time * 3) + 1) / 2
-            for i in range(4, 0, -1):
-                glow_radius = radius + i * 5 + int(pulse * 3)
-                glow_alpha = int((40 - i * 8) * (0.7 + pulse * 0.3))
-                glow_surface = pygame.Surface((glow_radius * 2 + 10, glow_radius * 2 + 10), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surface, (*glow_color, max(0, glow_alpha)),
-                                 (glow_radius + 5, glow_radius + 5), glow_radius)
-                screen.blit(glow_surface, (x - glow_radius - 5, y - glow_radius - 5))
+            glow_surface = self._get_pawn_glow(glow_color, radius, int(pulse * 3))
+            # The pulse brightens the whole glow through the surface alpha
+            glow_surface.set_alpha(int(255 * (0.7 + pulse * 0.3)))
+            half = glow_surface.get_width() // 2
+            screen.blit(glow_surface, (x - half, y - half))
         
         # Draw shadow
-        shadow_surface = pygame.Surface((radius * 2 + 10, radius * 2 + 10), pygame.SRCALPHA)
-        pygame.draw.circle(shadow_surface, (0, 0, 0, 40),
-                         (radius + 7, radius + 7), radius)
+        key = ('pawn_shadow', radius)
+        shadow_surface = self._glow_cache.get(key)
+        if shadow_surface is None:
+            shadow_surface = pygame.Surface((radius * 2 + 10, radius * 2 + 10), pygame.SRCALPHA)
+            pygame.draw.circle(shadow_surface, (0, 0, 0, 40),
+                             (radius + 7, radius + 7), radius)
+            shadow_surface = _to_display_format(shadow_surface)
+            self._glow_cache[key] = shadow_surface
         screen.blit(shadow_surface, (x - radius - 5, y - radius - 3))
         
         # Draw main pawn
@@ -307,16 +362,38 @@ class BoardRenderer:
         # Draw rim
         pygame.draw.circle(screen, self._darken_color(color, 0.8), (x, y), radius, 2)
     
+    def _get_pawn_glow(self, glow_color: Tuple[int, int, int], radius: int, grow: int) -> pygame.Surface:
+        """Get the 4-ring pawn glow composited into one cached surface"""
+        key = ('pawn', glow_color, radius, grow)
+        glow_surface = self._glow_cache.get(key)
+        if glow_surface is None:
+            outer_radius = radius + 4 * 5 + grow
+            center = outer_radius + 5
+            glow_surface = pygame.Surface((center * 2, center * 2), pygame.SRCALPHA)
+            
+            # Rings share one color, so each disc's alpha is the "over" composite
+            # of itself and every larger ring underneath it
+            coverage = 0.0
+            for i in range(4, 0, -1):
+                ring_alpha = (40 - i * 8) / 255
+                coverage = 1 - (1 - coverage) * (1 - ring_alpha)
+                pygame.draw.circle(glow_surface, (*glow_color, int(coverage * 255)),
+                                 (center, center), radius + i * 5 + grow)
+            glow_surface = _to_display_format(glow_surface)
+            self._glow_cache[key] = glow_surface
+        return glow_surface
+    
     def get_cell_at_pos(self, pos: Tuple[int, int]) -> Optional[Tuple[int, int]]:
         """Get board cell at screen position"""
         x, y = pos
+        stride = self.cell_size + self.wall_thickness
         
-        for row in range(self.board_size):
-            for col in range(self.board_size):
-                cell_x, cell_y = self._cell_to_screen(row, col)
-                if (cell_x <= x < cell_x + self.cell_size and
-                    cell_y <= y < cell_y + self.cell_size):
-                    return (row, col)
+        # Locate the cell directly, then reject points that fall in the wall gaps
+        col, rx = divmod(int(x) - self.offset_x, stride)
+        row, ry = divmod(int(y) - self.offset_y, stride)
+        if (0 <= row < self.board_size and 0 <= col < self.board_size and
+                rx < self.cell_size and ry < self.cell_size):
+            return (row, col)
         
         return None
     
@@ -330,9 +407,10 @@ class BoardRenderer:
                 ix = self.offset_x + (col + 1) * self.cell_size + col * self.wall_thickness + self.wall_thickness // 2
                 iy = self.offset_y + (row + 1) * self.cell_size + row * self.wall_thickness + self.wall_thickness // 2
                 
-                # Check distance from intersection
-                dist = math.sqrt((x - ix) ** 2 + (y - iy) ** 2)
-                if dist < self.cell_size * 0.8:
+                # Check squared distance from intersection
+                dx = x - ix
+                dy = y - iy
+                if dx * dx + dy * dy < self._wall_hit_r2:
                     return (row, col)
         
         return None
@@ -4,8 +4,7 @@ Central location for all game constants, colors, and configuration values.
 """
 
 from enum import Enum
-from dataclasses import dataclass
-from typing import Tuple
+from typing import NamedTuple, Tuple
 
 
 # =============================================================================
@@ -44,9 +43,11 @@ PAWN_MOVE_SPEED = 12.0
 # COLOR PALETTE - Modern Glassmorphism Theme
 # =============================================================================
 
-@dataclass(frozen=True)
-class ColorScheme:
-    """Modern color scheme with glassmorphism effects"""
+class ColorScheme(NamedTuple):
+    """
+    Modern color scheme with glassmorphism effects.
+    A NamedTuple so COLORS.X is a C-level tuple index rather than an instance dict lookup.
+    """
     
     # Backgrounds
     BG_PRIMARY: Tuple[int, int, int] = (15, 15, 25)
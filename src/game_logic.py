@@ -3,11 +3,17 @@ Quoridor Game - Game State and Logic
 Handles the core game mechanics including board state, moves, wall placement, and win conditions.
 """
 
-from typing import List, Tuple, Set, Optional
+from typing import Iterator, List, NamedTuple, Tuple, Optional
 from dataclasses import dataclass, field
 from enum import Enum
-from collections import deque
-import copy
+from functools import lru_cache
+import random
+import sys
+
+from .constants import BOARD_SIZE, WALLS_PER_PLAYER, PLAYER1_GOAL_ROW, PLAYER2_GOAL_ROW
+
+# Dataclass slots need Python 3.10+; older interpreters fall back to a __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 
 class Player(Enum):
@@ -22,53 +28,467 @@ class WallOrientation(Enum):
     VERTICAL = "V"
 
 
-@dataclass
+@dataclass(frozen=True)
 class Wall:
-    """Represents a wall on the board"""
+    """Represents a wall on the board (immutable, so walls can be shared and hashed)"""
+    __slots__ = ('row', 'col', 'orientation')
+    
     row: int
     col: int
     orientation: WallOrientation
     
-    def __hash__(self):
-        return hash((self.row, self.col, self.orientation))
+    def __reduce__(self):
+        # Frozen slotted instances can't be restored attribute by attribute
+        return (Wall, (self.row, self.col, self.orientation))
+
+
+class Undo(NamedTuple):
+    """Saved delta needed to revert an action applied with QuoridorGame.push"""
+    kind: str
+    prev_pos: Optional[Tuple[int, int]]
+    wall: Optional[int]  # Wall id
+    prev_turn: Player
+    prev_hash: int
+
+
+# =============================================================================
+# WALL IDS
+# =============================================================================
+
+# Walls are anchored on the (BOARD_SIZE - 1) x (BOARD_SIZE - 1) grid of intersections
+WALL_GRID_SIZE = BOARD_SIZE - 1
+
+# Internally a wall is a dense integer id: row * WALL_GRID_SIZE + col for
+# horizontal walls, offset by WALL_ID_VERTICAL for vertical ones. Wall objects
+# are only used at the public API boundary.
+WALL_ID_VERTICAL = WALL_GRID_SIZE * WALL_GRID_SIZE
+WALL_COUNT = 2 * WALL_ID_VERTICAL
+
+# Interned Wall objects indexed by wall id, so hot paths never construct walls
+WALLS_BY_ID = [
+    Wall(index // WALL_GRID_SIZE, index % WALL_GRID_SIZE, orientation)
+    for orientation in (WallOrientation.HORIZONTAL, WallOrientation.VERTICAL)
+    for index in range(WALL_ID_VERTICAL)
+]
+
+
+def wall_id(wall: Wall) -> int:
+    """Get the dense integer id of a wall"""
+    index = wall.row * WALL_GRID_SIZE + wall.col
+    return index if wall.orientation == WallOrientation.HORIZONTAL else index + WALL_ID_VERTICAL
+
+
+def wall_from_id(wid: int) -> Wall:
+    """Get the (shared) Wall object for a wall id"""
+    return WALLS_BY_ID[wid]
+
+
+# =============================================================================
+# ZOBRIST HASHING
+# =============================================================================
+
+# Fixed seed so position hashes are reproducible between runs
+_zobrist_rng = random.Random(0x9E3779B9)
+
+# Random keys for every (player, cell), (wall id), (player, walls remaining) and side to move
+ZOBRIST_PAWN = {
+    player: [[_zobrist_rng.getrandbits(64) for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+    for player in Player
+}
+ZOBRIST_WALL = [_zobrist_rng.getrandbits(64) for _ in range(WALL_COUNT)]
+ZOBRIST_WALLS_LEFT = {
+    player: [_zobrist_rng.getrandbits(64) for _ in range(WALLS_PER_PLAYER + 1)]
+    for player in Player
+}
+ZOBRIST_SIDE = _zobrist_rng.getrandbits(64)
+
+
+# =============================================================================
+# WALL BITBOARDS
+# =============================================================================
+
+# GameState.walls is one int over wall ids: the low WALL_ID_VERTICAL bits are the
+# horizontal walls and the high bits the vertical ones, so each half is a bitboard
+# where bit row * WALL_GRID_SIZE + col marks a wall anchored at that intersection.
+
+
+def _build_wall_conflicts() -> List[int]:
+    """
+    Build, for every wall id, the mask of wall ids it can't coexist with.
+    A horizontal wall overlaps horizontal walls one column left/right of it,
+    a vertical wall overlaps vertical walls one row above/below it. Walls of
+    either orientation also conflict with a wall at the same anchor (crossing).
+    """
+    conflicts = []
+    for wid, wall in enumerate(WALLS_BY_ID):
+        index = wall.row * WALL_GRID_SIZE + wall.col
+        # Crossing: either orientation at the same anchor (includes the wall itself)
+        mask = (1 << index) | (1 << (index + WALL_ID_VERTICAL))
+        if wall.orientation == WallOrientation.HORIZONTAL:
+            if wall.col > 0:
+                mask |= 1 << (wid - 1)
+            if wall.col < WALL_GRID_SIZE - 1:
+                mask |= 1 << (wid + 1)
+        else:
+            if wall.row > 0:
+                mask |= 1 << (wid - WALL_GRID_SIZE)
+            if wall.row < WALL_GRID_SIZE - 1:
+                mask |= 1 << (wid + WALL_GRID_SIZE)
+        conflicts.append(mask)
+    return conflicts
+
+
+WALL_CONFLICTS = _build_wall_conflicts()
+
+ALL_WALL_SLOTS = (1 << (WALL_GRID_SIZE * WALL_GRID_SIZE)) - 1
+WALL_FIRST_COL = sum(1 << (row * WALL_GRID_SIZE) for row in range(WALL_GRID_SIZE))
+WALL_LAST_COL = WALL_FIRST_COL << (WALL_GRID_SIZE - 1)
+
+
+# Cell bitboards use bit row * BOARD_SIZE + col. blocked_down marks cells whose
+# edge to the cell below is closed, blocked_right those whose edge to the right
+# is closed; the last row and column are always marked so shifts never wrap.
+ALL_CELLS = (1 << (BOARD_SIZE * BOARD_SIZE)) - 1
+LAST_ROW_CELLS = ((1 << BOARD_SIZE) - 1) << (BOARD_SIZE * (BOARD_SIZE - 1))
+LAST_COL_CELLS = sum(1 << (row * BOARD_SIZE + BOARD_SIZE - 1) for row in range(BOARD_SIZE))
+GOAL_ROW_CELLS = [((1 << BOARD_SIZE) - 1) << (row * BOARD_SIZE) for row in range(BOARD_SIZE)]
+
+# Row each player is racing towards
+GOAL_ROW = {Player.PLAYER1: PLAYER1_GOAL_ROW, Player.PLAYER2: PLAYER2_GOAL_ROW}
+
+
+def _build_wall_cuts() -> List[int]:
+    """For every wall id, get the cell bits it sets in blocked_down or blocked_right"""
+    wall_cuts = []
+    for wall in WALLS_BY_ID:
+        cell = wall.row * BOARD_SIZE + wall.col
+        if wall.orientation == WallOrientation.HORIZONTAL:
+            # A horizontal wall closes the downward edges of (row, col) and (row, col + 1)
+            wall_cuts.append((1 << cell) | (1 << (cell + 1)))
+        else:
+            # A vertical wall closes the rightward edges of (row, col) and (row + 1, col)
+            wall_cuts.append((1 << cell) | (1 << (cell + BOARD_SIZE)))
+    return wall_cuts
+
+
+def _build_wall_edge_masks() -> List[Tuple[int, int]]:
+    """For every wall id, get the two-cell masks of the two edges it blocks"""
+    edge_masks = []
+    for wall, cut in zip(WALLS_BY_ID, WALL_CUTS):
+        step = BOARD_SIZE if wall.orientation == WallOrientation.HORIZONTAL else 1
+        first = cut & -cut
+        second = cut ^ first
+        edge_masks.append((first | (first << step), second | (second << step)))
+    return edge_masks
+
+
+WALL_CUTS = _build_wall_cuts()
+WALL_EDGE_MASKS = _build_wall_edge_masks()
+
+# Path length reported when the goal row cannot be reached
+UNREACHABLE = float('inf')
+
+
+def _bfs_bitboard(blocked_down: int, blocked_right: int, start: int, goal_row: int) -> int:
+    """
+    Bit-parallel BFS kernel: the whole frontier is one int and each level is
+    expanded in all four directions with shifts and masks.
+    Returns the number of steps from start to the nearest cell on goal_row,
+    or infinity if the goal row is unreachable.
+    """
+    goal_mask = GOAL_ROW_CELLS[goal_row]
+    frontier = 1 << start
+    if frontier & goal_mask:
+        return 0
+    
+    open_down = ALL_CELLS & ~blocked_down
+    open_right = ALL_CELLS & ~blocked_right
+    visited = frontier
+    level = 0
     
-    def __eq__(self, other):
-        if not isinstance(other, Wall):
-            return False
-        return self.row == other.row and self.col == other.col and self.orientation == other.orientation
+    while frontier:
+        level += 1
+        frontier = (((frontier & open_down) << BOARD_SIZE) | ((frontier >> BOARD_SIZE) & open_down) |
+                    ((frontier & open_right) << 1) | ((frontier >> 1) & open_right)) & ~visited
+        if frontier & goal_mask:
+            return level
+        visited |= frontier
+    
+    return UNREACHABLE
+
 
+def _expand(cells: int, open_down: int, open_right: int) -> int:
+    """Get every cell one open step away from any cell in the mask"""
+    return (((cells & open_down) << BOARD_SIZE) | ((cells >> BOARD_SIZE) & open_down) |
+            ((cells & open_right) << 1) | ((cells >> 1) & open_right))
 
-@dataclass
+
+def _bfs_path_mask(blocked_down: int, blocked_right: int, start: int, goal_row: int) -> Optional[int]:
+    """
+    Bitboard BFS that keeps every level so one shortest path can be traced back.
+    Returns a cell mask of a shortest path from start to goal_row (both ends
+    included), or None if the goal row is unreachable.
+    """
+    goal_mask = GOAL_ROW_CELLS[goal_row]
+    frontier = 1 << start
+    if frontier & goal_mask:
+        return frontier
+    
+    open_down = ALL_CELLS & ~blocked_down
+    open_right = ALL_CELLS & ~blocked_right
+    visited = frontier
+    levels = [frontier]
+    
+    while frontier:
+        frontier = _expand(frontier, open_down, open_right) & ~visited
+        reached = frontier & goal_mask
+        if reached:
+            # Walk back from one goal cell, stepping into the previous level each time
+            cell = reached & -reached
+            path = cell
+            for level in reversed(levels):
+                cell = _expand(cell, open_down, open_right) & level
+                cell &= -cell
+                path |= cell
+            return path
+        visited |= frontier
+        levels.append(frontier)
+    
+    return None
+
+
+def _edge_reconnects(blocked_down: int, blocked_right: int, edge: int) -> bool:
+    """
+    Check whether the two cells of a blocked edge (a two-cell mask) are still
+    connected some other way. Both sides are flooded one level at a time, so
+    the search stops as soon as they meet or either side runs out of cells;
+    a detour around a single wall is usually found within a few levels.
+    """
+    first = edge & -edge
+    second = edge ^ first
+    open_down = ALL_CELLS & ~blocked_down
+    open_right = ALL_CELLS & ~blocked_right
+    near, far = first, second
+    near_frontier, far_frontier = first, second
+    
+    while near_frontier and far_frontier:
+        near_frontier = _expand(near_frontier, open_down, open_right) & ~near
+        if near_frontier & far:
+            return True
+        near |= near_frontier
+        # Alternate which side grows
+        near, far = far, near
+        near_frontier, far_frontier = far_frontier, near_frontier
+    
+    return False
+
+
+# Pawn step directions, in the order moves are generated
+STEP_UP, STEP_DOWN, STEP_LEFT, STEP_RIGHT = range(4)
+
+# Sideways directions tried (in order) when a straight jump is blocked
+STEP_SIDEWAYS = ((STEP_LEFT, STEP_RIGHT), (STEP_LEFT, STEP_RIGHT), (STEP_UP, STEP_DOWN), (STEP_UP, STEP_DOWN))
+
+# (row, col) of every cell index
+CELL_COORDS = [divmod(cell, BOARD_SIZE) for cell in range(BOARD_SIZE * BOARD_SIZE)]
+
+
+def _step(cells: int, direction: int, open_down: int, open_right: int) -> int:
+    """
+    Shift a cell mask one step in a direction, dropping every cell whose edge
+    that way is closed. The always-blocked last row and column double as the
+    board edge, so nothing wraps around.
+    """
+    if direction == STEP_UP:
+        return (cells >> BOARD_SIZE) & open_down
+    if direction == STEP_DOWN:
+        return (cells & open_down) << BOARD_SIZE
+    if direction == STEP_LEFT:
+        return (cells >> 1) & open_right
+    return (cells & open_right) << 1
+
+
+@lru_cache(maxsize=1 << 16)
+def _valid_moves_cached(current_pos: Tuple[int, int], opponent_pos: Tuple[int, int],
+                        blocked_down: int, blocked_right: int) -> Tuple[Tuple[int, int], ...]:
+    """
+    Compute the valid pawn moves from current_pos.
+    A pure function of its arguments (the edge bitboards fully describe the
+    walls), so results are memoized across transpositions and repeated calls.
+    """
+    open_down = ALL_CELLS & ~blocked_down
+    open_right = ALL_CELLS & ~blocked_right
+    current = 1 << (current_pos[0] * BOARD_SIZE + current_pos[1])
+    opponent = 1 << (opponent_pos[0] * BOARD_SIZE + opponent_pos[1])
+    
+    targets = []
+    for direction in (STEP_UP, STEP_DOWN, STEP_LEFT, STEP_RIGHT):
+        target = _step(current, direction, open_down, open_right)
+        if target != opponent:
+            if target:
+                targets.append(target)
+            continue
+        
+        # The opponent is in the way: jump straight over, or sideways if that is blocked
+        jump = _step(opponent, direction, open_down, open_right)
+        if jump:
+            targets.append(jump)
+            continue
+        for side in STEP_SIDEWAYS[direction]:
+            diagonal = _step(opponent, side, open_down, open_right)
+            if diagonal:
+                targets.append(diagonal)
+    
+    return tuple(CELL_COORDS[target.bit_length() - 1] for target in targets)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class GameState:
     """
     Represents the complete state of a Quoridor game.
     Board is 9x9, positions are (row, col) tuples.
-    Walls are placed between cells.
+    Walls are placed between cells and stored as a bitmask over wall ids
+    (bit wall_id(wall) is set for every placed wall).
     """
     board_size: int = 9
     player1_pos: Tuple[int, int] = (8, 4)  # Bottom center
     player2_pos: Tuple[int, int] = (0, 4)  # Top center
     player1_walls: int = 10
     player2_walls: int = 10
-    walls: Set[Wall] = field(default_factory=set)
+    walls: int = 0
     current_player: Player = Player.PLAYER1
     game_over: bool = False
     winner: Optional[Player] = None
+    zobrist: Optional[int] = field(default=None, compare=False, repr=False)
+    walls_hash: Optional[int] = field(default=None, compare=False, repr=False)
+    blocked_down: Optional[int] = field(default=None, compare=False, repr=False)
+    blocked_right: Optional[int] = field(default=None, compare=False, repr=False)
+    
+    def __post_init__(self):
+        if self.zobrist is None:
+            self.zobrist = self.compute_zobrist()
+        if self.walls_hash is None:
+            self.walls_hash = self.compute_walls_hash()
+        if self.blocked_down is None or self.blocked_right is None:
+            self.blocked_down = LAST_ROW_CELLS
+            self.blocked_right = LAST_COL_CELLS
+            for wid in self.iter_wall_ids():
+                if wid < WALL_ID_VERTICAL:
+                    self.blocked_down |= WALL_CUTS[wid]
+                else:
+                    self.blocked_right |= WALL_CUTS[wid]
+    
+    def compute_zobrist(self) -> int:
+        """Compute the Zobrist hash of this state from scratch"""
+        h = ZOBRIST_PAWN[Player.PLAYER1][self.player1_pos[0]][self.player1_pos[1]]
+        h ^= ZOBRIST_PAWN[Player.PLAYER2][self.player2_pos[0]][self.player2_pos[1]]
+        h ^= ZOBRIST_WALLS_LEFT[Player.PLAYER1][self.player1_walls]
+        h ^= ZOBRIST_WALLS_LEFT[Player.PLAYER2][self.player2_walls]
+        for wid in self.iter_wall_ids():
+            h ^= ZOBRIST_WALL[wid]
+        if self.current_player == Player.PLAYER2:
+            h ^= ZOBRIST_SIDE
+        return h
+    
+    def compute_walls_hash(self) -> int:
+        """Compute a hash of the placed walls only (unchanged by pawn moves)"""
+        h = 0
+        for wid in self.iter_wall_ids():
+            h ^= ZOBRIST_WALL[wid]
+        return h
+    
+    def add_wall(self, wid: int):
+        """Add a wall by id, keeping the hashes and bitboards in sync"""
+        self.walls |= 1 << wid
+        key = ZOBRIST_WALL[wid]
+        self.zobrist ^= key
+        self.walls_hash ^= key
+        if wid < WALL_ID_VERTICAL:
+            self.blocked_down |= WALL_CUTS[wid]
+        else:
+            self.blocked_right |= WALL_CUTS[wid]
+    
+    def remove_wall(self, wid: int):
+        """Remove a wall by id, keeping the hashes and bitboards in sync"""
+        self.walls &= ~(1 << wid)
+        key = ZOBRIST_WALL[wid]
+        self.zobrist ^= key
+        self.walls_hash ^= key
+        if wid < WALL_ID_VERTICAL:
+            self.blocked_down &= ~WALL_CUTS[wid]
+        else:
+            self.blocked_right &= ~WALL_CUTS[wid]
+    
+    @property
+    def h_walls(self) -> int:
+        """Bitboard of placed horizontal walls (bit row * WALL_GRID_SIZE + col)"""
+        return self.walls & ALL_WALL_SLOTS
+    
+    @property
+    def v_walls(self) -> int:
+        """Bitboard of placed vertical walls (bit row * WALL_GRID_SIZE + col)"""
+        return self.walls >> WALL_ID_VERTICAL
+    
+    def iter_wall_ids(self) -> Iterator[int]:
+        """Iterate over the ids of the placed walls, lowest first"""
+        walls = self.walls
+        while walls:
+            lowest = walls & -walls
+            yield lowest.bit_length() - 1
+            walls ^= lowest
+    
+    def iter_walls(self) -> Iterator[Wall]:
+        """Iterate over the placed walls as Wall objects"""
+        return (WALLS_BY_ID[wid] for wid in self.iter_wall_ids())
+    
+    def get_open_wall_slots(self) -> Tuple[int, int]:
+        """
+        Get bitboards of wall slots that do not overlap or cross any placed wall.
+        Returns (open_horizontal, open_vertical). Path blocking is not checked.
+        """
+        h_walls, v_walls = self.h_walls, self.v_walls
+        
+        # Horizontal walls are blocked by horizontal neighbors in the same row
+        blocked_h = (h_walls | ((h_walls << 1) & ~WALL_FIRST_COL) |
+                     ((h_walls >> 1) & ~WALL_LAST_COL) | v_walls)
+        # Vertical walls are blocked by vertical neighbors in the same column
+        blocked_v = (v_walls | (v_walls << WALL_GRID_SIZE) |
+                     (v_walls >> WALL_GRID_SIZE) | h_walls)
+        
+        return ALL_WALL_SLOTS & ~blocked_h, ALL_WALL_SLOTS & ~blocked_v
+    
+    @classmethod
+    def _fast_clone(cls, other: 'GameState') -> 'GameState':
+        """
+        Clone a state without going through __init__/__post_init__.
+        Every field is an immutable value, so the copy shares them all.
+        """
+        new_state = object.__new__(cls)
+        new_state.board_size = other.board_size
+        new_state.player1_pos = other.player1_pos
+        new_state.player2_pos = other.player2_pos
+        new_state.player1_walls = other.player1_walls
+        new_state.player2_walls = other.player2_walls
+        new_state.walls = other.walls
+        new_state.current_player = other.current_player
+        new_state.game_over = other.game_over
+        new_state.winner = other.winner
+        new_state.zobrist = other.zobrist
+        new_state.walls_hash = other.walls_hash
+        new_state.blocked_down = other.blocked_down
+        new_state.blocked_right = other.blocked_right
+        return new_state
     
     def copy(self) -> 'GameState':
         """Create a deep copy of the game state"""
-        new_state = GameState(
-            board_size=self.board_size,
-            player1_pos=self.player1_pos,
-            player2_pos=self.player2_pos,
-            player1_walls=self.player1_walls,
-            player2_walls=self.player2_walls,
-            walls=self.walls.copy(),
-            current_player=self.current_player,
-            game_over=self.game_over,
-            winner=self.winner
-        )
-        return new_state
+        return GameState._fast_clone(self)
+    
+    def __copy__(self) -> 'GameState':
+        return GameState._fast_clone(self)
+    
+    def __deepcopy__(self, memo) -> 'GameState':
+        # Every field is immutable, so a shallow clone is already a deep copy
+        return GameState._fast_clone(self)
     
     def get_current_player_pos(self) -> Tuple[int, int]:
         """Get position of current player"""
@@ -92,53 +512,43 @@ class QuoridorGame:
     def __init__(self):
         self.state = GameState()
         self.move_history: List[Tuple] = []
+        # Per-player (key, path mask) of the last shortest path, used to skip reachability BFS
+        self._path_masks: dict = {}
+        # (Zobrist hash, walls) of the last get_all_valid_walls result
+        self._valid_walls_memo: Optional[Tuple[int, Tuple[Wall, ...]]] = None
     
     def reset(self):
         """Reset the game to initial state"""
         self.state = GameState()
         self.move_history = []
+        self._path_masks = {}
+        self._valid_walls_memo = None
+    
+    def copy(self) -> 'QuoridorGame':
+        """Create an independent game at the current position (move history is not copied)"""
+        game = QuoridorGame()
+        game.state = self.state.copy()
+        return game
+    
+    def get_hash(self) -> int:
+        """Get the Zobrist hash of the current position"""
+        return self.state.zobrist
     
     def is_valid_position(self, row: int, col: int) -> bool:
         """Check if position is within board bounds"""
-        return 0 <= row < self.state.board_size and 0 <= col < self.state.board_size
+        return 0 <= row < BOARD_SIZE and 0 <= col < BOARD_SIZE
     
     def is_wall_between(self, pos1: Tuple[int, int], pos2: Tuple[int, int]) -> bool:
         """Check if there's a wall between two adjacent positions"""
         r1, c1 = pos1
         r2, c2 = pos2
         
-        # Moving vertically (up or down)
+        # Moving vertically (up or down): test the downward edge of the upper cell
         if c1 == c2:
-            if r2 < r1:  # Moving up
-                wall_row = r1 - 1
-                # Check for horizontal wall at this position
-                for wall in self.state.walls:
-                    if wall.orientation == WallOrientation.HORIZONTAL:
-                        if wall.row == wall_row and (wall.col == c1 or wall.col == c1 - 1):
-                            return True
-            else:  # Moving down
-                wall_row = r1
-                for wall in self.state.walls:
-                    if wall.orientation == WallOrientation.HORIZONTAL:
-                        if wall.row == wall_row and (wall.col == c1 or wall.col == c1 - 1):
-                            return True
-        
-        # Moving horizontally (left or right)
-        if r1 == r2:
-            if c2 < c1:  # Moving left
-                wall_col = c1 - 1
-                for wall in self.state.walls:
-                    if wall.orientation == WallOrientation.VERTICAL:
-                        if wall.col == wall_col and (wall.row == r1 or wall.row == r1 - 1):
-                            return True
-            else:  # Moving right
-                wall_col = c1
-                for wall in self.state.walls:
-                    if wall.orientation == WallOrientation.VERTICAL:
-                        if wall.col == wall_col and (wall.row == r1 or wall.row == r1 - 1):
-                            return True
-        
-        return False
+            return (self.state.blocked_down >> (min(r1, r2) * BOARD_SIZE + c1)) & 1 == 1
+        
+        # Moving horizontally (left or right): test the rightward edge of the left cell
+        return (self.state.blocked_right >> (r1 * BOARD_SIZE + min(c1, c2))) & 1 == 1
     
     def get_valid_moves(self, player: Optional[Player] = None) -> List[Tuple[int, int]]:
         """Get all valid moves for a player"""
@@ -152,196 +562,110 @@ class QuoridorGame:
             current_pos = self.state.player2_pos
             opponent_pos = self.state.player1_pos
         
-        valid_moves = []
-        row, col = current_pos
-        
-        # Basic moves: up, down, left, right
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        
-        for dr, dc in directions:
-            new_row, new_col = row + dr, col + dc
-            
-            if not self.is_valid_position(new_row, new_col):
-                continue
-            
-            if self.is_wall_between(current_pos, (new_row, new_col)):
-                continue
-            
-            # Check if opponent is in the way
-            if (new_row, new_col) == opponent_pos:
-                # Try to jump over opponent
-                jump_row, jump_col = new_row + dr, new_col + dc
-                
-                if self.is_valid_position(jump_row, jump_col) and \
-                   not self.is_wall_between(opponent_pos, (jump_row, jump_col)):
-                    valid_moves.append((jump_row, jump_col))
-                else:
-                    # Diagonal moves if jump is blocked
-                    if dr == 0:  # Moving horizontally, try vertical diagonals
-                        for ddr in [-1, 1]:
-                            diag_row, diag_col = new_row + ddr, new_col
-                            if self.is_valid_position(diag_row, diag_col) and \
-                               not self.is_wall_between(opponent_pos, (diag_row, diag_col)):
-                                valid_moves.append((diag_row, diag_col))
-                    else:  # Moving vertically, try horizontal diagonals
-                        for ddc in [-1, 1]:
-                            diag_row, diag_col = new_row, new_col + ddc
-                            if self.is_valid_position(diag_row, diag_col) and \
-                               not self.is_wall_between(opponent_pos, (diag_row, diag_col)):
-                                valid_moves.append((diag_row, diag_col))
-            else:
-                valid_moves.append((new_row, new_col))
-        
-        return valid_moves
+        return list(_valid_moves_cached(current_pos, opponent_pos,
+                                        self.state.blocked_down, self.state.blocked_right))
     
     def can_place_wall(self, wall: Wall) -> bool:
-        """Check if a wall can be placed at the given position"""
+        """
+        Check if a wall can be placed at the given position.
+        Checks run cheapest first; the path search only runs for walls that pass the rest.
+        """
         # Check if player has walls remaining
         if self.state.get_current_player_walls() <= 0:
             return False
         
-        # Check if wall position is valid
-        if wall.orientation == WallOrientation.HORIZONTAL:
-            if not (0 <= wall.row < self.state.board_size - 1 and 
-                    0 <= wall.col < self.state.board_size - 1):
-                return False
-        else:
-            if not (0 <= wall.row < self.state.board_size - 1 and 
-                    0 <= wall.col < self.state.board_size - 1):
-                return False
-        
-        # Check if wall overlaps with existing walls
-        if wall in self.state.walls:
+        # Check if wall position is valid (the same range for both orientations)
+        if not (0 <= wall.row < WALL_GRID_SIZE and 0 <= wall.col < WALL_GRID_SIZE):
             return False
         
-        # Check for crossing walls
-        for existing_wall in self.state.walls:
-            if self._walls_overlap(wall, existing_wall):
-                return False
+        # Check if wall overlaps or crosses existing walls (a single bitwise AND)
+        if self.state.walls & WALL_CONFLICTS[wall_id(wall)]:
+            return False
         
         # Check if wall blocks all paths (must leave at least one path for each player)
-        test_state = self.state.copy()
-        test_state.walls.add(wall)
-        
-        # Save current state and temporarily use test state
-        original_state = self.state
-        self.state = test_state
-        
-        p1_has_path = self._has_path_to_goal(self.state.player1_pos, Player.PLAYER1)
-        p2_has_path = self._has_path_to_goal(self.state.player2_pos, Player.PLAYER2)
-        
-        # Restore original state
-        self.state = original_state
+        return self.keeps_paths_open(wall)
+    
+    def keeps_paths_open(self, wall: Wall) -> bool:
+        """Check that both players can still reach their goal rows with the wall added"""
+        wid = wall_id(wall)
+        first_edge, second_edge = WALL_EDGE_MASKS[wid]
+        cut = []
+        for player in (Player.PLAYER1, Player.PLAYER2):
+            path = self.get_shortest_path_mask(player)
+            # A wall only needs a search if it cuts an edge of the cached shortest path;
+            # otherwise that path survives and the player still reaches the goal.
+            if path is None:
+                cut.append((player, []))
+                continue
+            if path & first_edge == first_edge or path & second_edge == second_edge:
+                cut.append((player, [edge for edge in (first_edge, second_edge) if path & edge == edge]))
         
-        return p1_has_path and p2_has_path
-
-    def _walls_overlap(self, wall1: Wall, wall2: Wall) -> bool:
-        """Check if two walls overlap or cross"""
-        # Same position and orientation
-        if wall1.row == wall2.row and wall1.col == wall2.col:
+        if not cut:
             return True
         
-        # Same orientation - check if they overlap
-        if wall1.orientation == wall2.orientation:
-            if wall1.orientation == WallOrientation.HORIZONTAL:
-                if wall1.row == wall2.row:
-                    return abs(wall1.col - wall2.col) <= 1
-            else:
-                if wall1.col == wall2.col:
-                    return abs(wall1.row - wall2.row) <= 1
+        # Apply the wall to local copies of the edge bitboards; the state itself is
+        # never modified, so there is nothing to roll back if anything fails
+        blocked_down, blocked_right = self.state.blocked_down, self.state.blocked_right
+        if wid < WALL_ID_VERTICAL:
+            blocked_down |= WALL_CUTS[wid]
         else:
-            # Different orientation - check if they cross
-            if wall1.orientation == WallOrientation.HORIZONTAL:
-                h_wall, v_wall = wall1, wall2
-            else:
-                h_wall, v_wall = wall2, wall1
-            
-            # Check if they cross at the center
-            if h_wall.row == v_wall.row and h_wall.col == v_wall.col:
-                return True
+            blocked_right |= WALL_CUTS[wid]
         
-        return False
-    
+        for player, cut_edges in cut:
+            # If the ends of every cut edge are still connected, the rest of the
+            # path plus those detours still leads to the goal
+            if cut_edges and all(_edge_reconnects(blocked_down, blocked_right, edge) for edge in cut_edges):
+                continue
+            row, col = self._get_player_pos(player)
+            goal_row = GOAL_ROW[player]
+            if _bfs_bitboard(blocked_down, blocked_right, row * BOARD_SIZE + col, goal_row) == UNREACHABLE:
+                return False
+        
+        return True
+
+    def _get_player_pos(self, player: Player) -> Tuple[int, int]:
+        """Get the position of the given player"""
+        return self.state.player1_pos if player == Player.PLAYER1 else self.state.player2_pos
+
+    def get_shortest_path_mask(self, player: Player) -> Optional[int]:
+        """
+        Get a cell bitboard of one shortest path to the goal row for a player.
+        Cached until the player moves or the walls change.
+        """
+        row, col = self._get_player_pos(player)
+        start = row * BOARD_SIZE + col
+        key = (start, self.state.walls_hash)
+        
+        cached = self._path_masks.get(player)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        goal_row = GOAL_ROW[player]
+        path = _bfs_path_mask(self.state.blocked_down, self.state.blocked_right, start, goal_row)
+        self._path_masks[player] = (key, path)
+        return path
+
     def _has_path_to_goal(self, start: Tuple[int, int], player: Player) -> bool:
         """Check if there's a path from start to the goal row using BFS"""
-        goal_row = 0 if player == Player.PLAYER1 else self.state.board_size - 1
-        
-        visited = set()
-        queue = deque([start])
-        visited.add(start)
-        
-        while queue:
-            current = queue.popleft()
-            row, col = current
-            
-            if row == goal_row:
-                return True
-            
-            # Check all four directions
-            for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                new_row, new_col = row + dr, col + dc
-                
-                if not self.is_valid_position(new_row, new_col):
-                    continue
-                
-                if (new_row, new_col) in visited:
-                    continue
-                
-                if self.is_wall_between(current, (new_row, new_col)):
-                    continue
-                
-                visited.add((new_row, new_col))
-                queue.append((new_row, new_col))
-        
-        return False
+        return self.get_shortest_path_length(start, player) != UNREACHABLE
     
     def get_shortest_path_length(self, start: Tuple[int, int], player: Player) -> int:
-        """Get the length of shortest path to goal row using BFS"""
-        goal_row = 0 if player == Player.PLAYER1 else self.state.board_size - 1
-        
-        visited = set()
-        queue = deque([(start, 0)])
-        visited.add(start)
-        
-        while queue:
-            current, dist = queue.popleft()
-            row, col = current
-            
-            if row == goal_row:
-                return dist
-            
-            for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                new_row, new_col = row + dr, col + dc
-                
-                if not self.is_valid_position(new_row, new_col):
-                    continue
-                
-                if (new_row, new_col) in visited:
-                    continue
-                
-                if self.is_wall_between(current, (new_row, new_col)):
-                    continue
-                
-                visited.add((new_row, new_col))
-                queue.append(((new_row, new_col), dist + 1))
-        
-        return float('inf')
+        """Get the length of shortest path to goal row using a bitboard BFS"""
+        return self.get_cell_path_length(start[0] * BOARD_SIZE + start[1], player)
+    
+    def get_cell_path_length(self, cell: int, player: Player) -> int:
+        """Same as get_shortest_path_length, with the start given as a flat cell index"""
+        goal_row = GOAL_ROW[player]
+        return _bfs_bitboard(self.state.blocked_down, self.state.blocked_right, cell, goal_row)
     
     def move_player(self, new_pos: Tuple[int, int]) -> bool:
         """Move current player to new position"""
         if new_pos not in self.get_valid_moves():
             return False
         
-        if self.state.current_player == Player.PLAYER1:
-            old_pos = self.state.player1_pos
-            self.state.player1_pos = new_pos
-        else:
-            old_pos = self.state.player2_pos
-            self.state.player2_pos = new_pos
-        
-        self.move_history.append(('move', self.state.current_player, old_pos, new_pos))
-        self._check_win()
-        self._switch_player()
+        player = self.state.current_player
+        undo = self.push(("move", new_pos))
+        self.move_history.append(('move', player, undo.prev_pos, new_pos))
         
         return True
     
@@ -350,24 +674,82 @@ class QuoridorGame:
         if not self.can_place_wall(wall):
             return False
         
-        self.state.walls.add(wall)
+        player = self.state.current_player
+        self.push(("wall", wall))
+        self.move_history.append(('wall', player, wall))
         
-        if self.state.current_player == Player.PLAYER1:
-            self.state.player1_walls -= 1
+        return True
+    
+    def push(self, action: Tuple[str, any]) -> Undo:
+        """
+        Apply an action without validation or history tracking.
+        Used by the AI search for fast make/unmake - revert with pop().
+        
+        Args:
+            action: Tuple of ("move", position) or ("wall", Wall)
+        """
+        state = self.state
+        kind, data = action
+        player = state.current_player
+        prev_hash = state.zobrist
+        
+        if kind == "move":
+            if player == Player.PLAYER1:
+                prev_pos = state.player1_pos
+                state.player1_pos = data
+            else:
+                prev_pos = state.player2_pos
+                state.player2_pos = data
+            
+            pawn_keys = ZOBRIST_PAWN[player]
+            state.zobrist ^= pawn_keys[prev_pos[0]][prev_pos[1]] ^ pawn_keys[data[0]][data[1]]
+            undo = Undo(kind, prev_pos, None, player, prev_hash)
+            self._check_win()
         else:
-            self.state.player2_walls -= 1
+            wid = wall_id(data)
+            state.add_wall(wid)
+            
+            if player == Player.PLAYER1:
+                walls_left = state.player1_walls
+                state.player1_walls -= 1
+            else:
+                walls_left = state.player2_walls
+                state.player2_walls -= 1
+            
+            walls_left_keys = ZOBRIST_WALLS_LEFT[player]
+            state.zobrist ^= walls_left_keys[walls_left] ^ walls_left_keys[walls_left - 1]
+            undo = Undo(kind, None, wid, player, prev_hash)
         
-        self.move_history.append(('wall', self.state.current_player, wall))
         self._switch_player()
+        return undo
+    
+    def pop(self, undo: Undo):
+        """Revert an action applied with push()"""
+        state = self.state
         
-        return True
+        if undo.kind == "move":
+            if undo.prev_turn == Player.PLAYER1:
+                state.player1_pos = undo.prev_pos
+            else:
+                state.player2_pos = undo.prev_pos
+        else:
+            state.remove_wall(undo.wall)
+            if undo.prev_turn == Player.PLAYER1:
+                state.player1_walls += 1
+            else:
+                state.player2_walls += 1
+        
+        state.current_player = undo.prev_turn
+        state.zobrist = undo.prev_hash
+        state.game_over = False
+        state.winner = None
     
     def _check_win(self):
         """Check if current player has won"""
-        if self.state.player1_pos[0] == 0:
+        if self.state.player1_pos[0] == PLAYER1_GOAL_ROW:
             self.state.game_over = True
             self.state.winner = Player.PLAYER1
-        elif self.state.player2_pos[0] == self.state.board_size - 1:
+        elif self.state.player2_pos[0] == PLAYER2_GOAL_ROW:
             self.state.game_over = True
             self.state.winner = Player.PLAYER2
     
@@ -377,6 +759,7 @@ class QuoridorGame:
             self.state.current_player = Player.PLAYER2
         else:
             self.state.current_player = Player.PLAYER1
+        self.state.zobrist ^= ZOBRIST_SIDE
     
     def get_all_valid_walls(self) -> List[Wall]:
         """Get all valid wall placements for current player"""
@@ -385,13 +768,23 @@ class QuoridorGame:
         if self.state.get_current_player_walls() <= 0:
             return valid_walls
         
-        for row in range(self.state.board_size - 1):
-            for col in range(self.state.board_size - 1):
-                for orientation in WallOrientation:
-                    wall = Wall(row, col, orientation)
-                    if self.can_place_wall(wall):
-                        valid_walls.append(wall)
-        
+        # Repeated calls for the same position reuse the last result
+        if self._valid_walls_memo is not None and self._valid_walls_memo[0] == self.state.zobrist:
+            return list(self._valid_walls_memo[1])
+        
+        # Only slots that don't overlap or cross a placed wall need the path check.
+        # Anchors are visited in row-major order, horizontal before vertical.
+        open_h, open_v = self.state.get_open_wall_slots()
+        anchors = open_h | open_v
+        while anchors:
+            lowest = anchors & -anchors
+            anchors ^= lowest
+            index = lowest.bit_length() - 1
+            for open_slots, wid in ((open_h, index), (open_v, index + WALL_ID_VERTICAL)):
+                if open_slots & lowest and self.keeps_paths_open(WALLS_BY_ID[wid]):
+                    valid_walls.append(WALLS_BY_ID[wid])
+        
+        self._valid_walls_memo = (self.state.zobrist, tuple(valid_walls))
         return valid_walls
     
     def undo_move(self) -> bool:
@@ -407,13 +800,19 @@ class QuoridorGame:
                 self.state.player1_pos = old_pos
             else:
                 self.state.player2_pos = old_pos
+            pawn_keys = ZOBRIST_PAWN[player]
+            self.state.zobrist ^= pawn_keys[old_pos[0]][old_pos[1]] ^ pawn_keys[new_pos[0]][new_pos[1]]
         else:  # wall
             _, player, wall = last_move
-            self.state.walls.remove(wall)
+            self.state.remove_wall(wall_id(wall))
             if player == Player.PLAYER1:
                 self.state.player1_walls += 1
+                walls_left = self.state.player1_walls
             else:
                 self.state.player2_walls += 1
+                walls_left = self.state.player2_walls
+            walls_left_keys = ZOBRIST_WALLS_LEFT[player]
+            self.state.zobrist ^= walls_left_keys[walls_left] ^ walls_left_keys[walls_left - 1]
         
         self._switch_player()
         self.state.game_over = False
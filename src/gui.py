@@ -7,7 +7,8 @@ Refactored with modular architecture for clean separation of concerns.
 import pygame
 import sys
 import math
-from typing import Tuple, Optional, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Tuple, Optional, List
 
 from .constants import (
     COLORS, SCREEN_WIDTH, SCREEN_HEIGHT, FPS,
@@ -22,6 +23,16 @@ from .ui_components import ModernButton, GlassPanel, ProgressBar, Tooltip
 from .board_renderer import BoardRenderer
 from .screens import ScreenManager, GameOverOverlay
 
+# Transparent color for pre-drawn opaque icons
+_ICON_COLORKEY = (255, 0, 255)
+
+# Player 2 panel label per game mode (modes without an AI show "Player 2")
+_AI_LABEL = {
+    GameMode.PVE_EASY: "AI (Easy)",
+    GameMode.PVE_MEDIUM: "AI (Medium)",
+    GameMode.PVE_HARD: "AI (Hard)",
+}
+
 
 class GameGUI:
     """
@@ -82,6 +93,33 @@ class GameGUI:
         self.ai_thinking = False
         self.ai_think_timer = 0.0
         
+        # The AI searches on a worker thread so the frame loop keeps running
+        self._ai_executor = ThreadPoolExecutor(max_workers=1)
+        self._ai_future: Optional[Future] = None
+        
+        # Validity of the last wall preview checked, keyed by (wall, position hash)
+        self._preview_validity: Optional[Tuple[Tuple[Wall, int], bool]] = None
+        
+        # Newest board hover position, applied once per frame in _update
+        self._pending_mouse_pos: Optional[Tuple[int, int]] = None
+        
+        # Pre-rendered gradient background, rebuilt when the screen size changes
+        self._background: Optional[pygame.Surface] = None
+        
+        # Background with the resting player panels' glass composited on,
+        # keyed by the panels' placement and highlight
+        self._ui_background: Optional[pygame.Surface] = None
+        self._ui_background_key: Optional[Tuple] = None
+        
+        # Pre-rendered pawn icon glows keyed by (color, radius, grow)
+        self._glow_cache: Dict[Tuple, pygame.Surface] = {}
+        
+        # Pre-rendered pawn icons (shadow, body and highlight) keyed by (color, radius)
+        self._pawn_icon_cache: Dict[Tuple, pygame.Surface] = {}
+        
+        # Rendered text keyed by (text, font name, color)
+        self._text_cache: Dict[Tuple, pygame.Surface] = {}
+        
         # Game over overlay
         self.game_over_overlay: Optional[GameOverOverlay] = None
         
@@ -142,6 +180,8 @@ class GameGUI:
         self.valid_moves = self.game.get_valid_moves()
         self.wall_placement_mode = False
         self.game_over_overlay = None
+        self._pending_mouse_pos = None
+        self._cancel_ai_move()
         
         # Setup AI if needed
         if mode == GameMode.PVE_EASY:
@@ -159,6 +199,7 @@ class GameGUI:
         self.screen_manager.return_to_menu()
         self.game.reset()
         self.game_over_overlay = None
+        self._cancel_ai_move()
     
     def _restart_game(self):
         """Restart current game"""
@@ -177,6 +218,7 @@ class GameGUI:
     
     def _quit_game(self):
         """Quit the application"""
+        self._ai_executor.shutdown(wait=False)
         pygame.quit()
         sys.exit()
     
@@ -196,6 +238,11 @@ class GameGUI:
             self.screen_height = SCREEN_HEIGHT
             self.screen = pygame.display.set_mode(self.windowed_size)
         
+        # Cached surfaces were converted to the old display format
+        self._glow_cache.clear()
+        self._pawn_icon_cache.clear()
+        self._text_cache.clear()
+        
         # Recalculate board position for new screen size
         self._recalculate_layout()
         
@@ -230,23 +277,28 @@ class GameGUI:
         
         while running:
             dt = self.clock.tick(FPS) / 1000.0
-            self.animation_time += dt
             
-            # Handle events
-            for event in pygame.event.get():
+            # Handle events. Hover state only depends on the newest mouse position,
+            # so a motion event directly followed by another one is skipped. Only
+            # consecutive runs collapse: the motion right before a click is kept.
+            events = pygame.event.get()
+            for event, next_event in zip(events, events[1:] + [None]):
                 if event.type == pygame.QUIT:
                     running = False
-                else:
+                elif (event.type != pygame.MOUSEMOTION or next_event is None
+                        or next_event.type != pygame.MOUSEMOTION):
                     self._handle_event(event)
             
             # Update
             self._update(dt)
             
-            # Draw
-            self._draw()
-            
-            pygame.display.flip()
+            # Draw. Every frame has something animating (the current player's
+            # glow pulses), but nothing is visible while the window is minimized
+            if pygame.display.get_active():
+                self._draw()
+                pygame.display.flip()
         
+        self._ai_executor.shutdown(wait=False)
         pygame.quit()
     
     def _handle_event(self, event: pygame.event.Event):
@@ -270,9 +322,8 @@ class GameGUI:
                     return
             
             # Handle button events
-            for button in self.game_buttons:
-                if button.handle_event(event):
-                    return
+            if ModernButton.handle_group_event(self.game_buttons, event):
+                return
             
             # Don't handle game input if game is over or AI is thinking
             if self.game.state.game_over or self.ai_thinking:
@@ -287,9 +338,11 @@ class GameGUI:
     def _handle_game_event(self, event: pygame.event.Event):
         """Handle game-specific events"""
         if event.type == pygame.MOUSEMOTION:
-            self._handle_mouse_motion(event.pos)
+            self._pending_mouse_pos = event.pos
         
         elif event.type == pygame.MOUSEBUTTONDOWN:
+            # A click acts on the hover state, so bring it up to date first
+            self._flush_mouse_motion()
             if event.button == 1:  # Left click
                 self._handle_left_click(event.pos)
             elif event.button == 3:  # Right click - rotate wall
@@ -299,6 +352,13 @@ class GameGUI:
         elif event.type == pygame.KEYDOWN:
             self._handle_key_press(event.key)
     
+    def _flush_mouse_motion(self):
+        """Apply the newest buffered mouse position to the hover state"""
+        if self._pending_mouse_pos is not None:
+            pos = self._pending_mouse_pos
+            self._pending_mouse_pos = None
+            self._handle_mouse_motion(pos)
+    
     def _handle_mouse_motion(self, pos: Tuple[int, int]):
         """Handle mouse movement"""
         # Update board renderer hover state
@@ -313,16 +373,12 @@ class GameGUI:
                 self.wall_preview = Wall(row, col, self.wall_orientation)
             else:
                 self.wall_preview = None
-        
-        # Update button hover states
-        for button in self.game_buttons:
-            button.hovered = button.rect.collidepoint(pos)
     
     def _handle_left_click(self, pos: Tuple[int, int]):
         """Handle left mouse click"""
         if self.wall_placement_mode:
             # Try to place wall
-            if self.wall_preview and self.game.can_place_wall(self.wall_preview):
+            if self.wall_preview and self._is_preview_valid():
                 self.game.place_wall(self.wall_preview)
                 self.wall_placement_mode = False
                 self.wall_preview = None
@@ -337,6 +393,13 @@ class GameGUI:
                 self.valid_moves = self.game.get_valid_moves()
                 self._check_game_over()
     
+    def _is_preview_valid(self) -> bool:
+        """Check the wall preview, reusing the answer while neither it nor the position changes"""
+        key = (self.wall_preview, self.game.get_hash())
+        if self._preview_validity is None or self._preview_validity[0] != key:
+            self._preview_validity = (key, self.game.can_place_wall(self.wall_preview))
+        return self._preview_validity[1]
+    
     def _handle_key_press(self, key: int):
         """Handle keyboard input"""
         if key == pygame.K_w:
@@ -392,10 +455,13 @@ class GameGUI:
             self.screen_manager.update(dt)
         
         elif self.current_screen == ScreenState.GAME:
+            state = self.game.state
+            
+            # Only the game screen's pawn glow pulses off this clock
+            self.animation_time += dt
+            
             # Update board renderer
-            self.board_renderer.update(dt, 
-                                       self.game.state.player1_pos,
-                                       self.game.state.player2_pos)
+            self.board_renderer.update(dt, state.player1_pos, state.player2_pos)
             
             # Update UI components
             for button in self.game_buttons:
@@ -405,13 +471,13 @@ class GameGUI:
             self.player2_panel.update(dt)
             
             # Update wall bars
-            self.player1_walls_bar.set_value(self.game.state.player1_walls)
-            self.player2_walls_bar.set_value(self.game.state.player2_walls)
+            self.player1_walls_bar.set_value(state.player1_walls)
+            self.player2_walls_bar.set_value(state.player2_walls)
             self.player1_walls_bar.update(dt)
             self.player2_walls_bar.update(dt)
             
             # Update panel highlights
-            is_p1_turn = self.game.state.current_player == Player.PLAYER1
+            is_p1_turn = state.current_player == Player.PLAYER1
             self.player1_panel.set_highlight(is_p1_turn, COLORS.PLAYER1_PRIMARY)
             self.player2_panel.set_highlight(not is_p1_turn, COLORS.PLAYER2_PRIMARY)
             
@@ -422,24 +488,36 @@ class GameGUI:
             # Update tooltip
             self.tooltip.update(dt)
             
-            # Handle AI turn
+            # Hover state follows the mouse at the frame rate, not the event rate
+            self._flush_mouse_motion()
+            
+            # Handle AI turn: start the search right away, apply its move once
+            # both the search and the short visual delay are done
             if self._is_ai_turn() and not self.ai_thinking:
                 self.ai_thinking = True
                 self.ai_think_timer = 0.4  # Small delay for visual feedback
+                self._ai_future = self._ai_executor.submit(self.ai.get_best_move, self.game.copy())
             
             if self.ai_thinking:
                 self.ai_think_timer -= dt
-                if self.ai_think_timer <= 0:
-                    self._execute_ai_move()
+                if self.ai_think_timer <= 0 and self._ai_future.done():
+                    future = self._ai_future
+                    self._ai_future = None
                     self.ai_thinking = False
+                    self._execute_ai_move(*future.result())
+    
+    def _cancel_ai_move(self):
+        """Forget any AI search in progress (its result is for a game that no longer exists)"""
+        if self._ai_future is not None:
+            self._ai_future.cancel()
+            self._ai_future = None
+        self.ai_thinking = False
     
-    def _execute_ai_move(self):
+    def _execute_ai_move(self, move_type: str, move_data):
         """Execute AI move"""
         if not self.ai or self.game.state.game_over:
             return
         
-        move_type, move_data = self.ai.get_best_move(self.game)
-        
         if move_type == "move":
             self.game.move_player(move_data)
         else:
@@ -458,25 +536,27 @@ class GameGUI:
     
     def _draw_game(self):
         """Draw the game screen"""
+        state = self.game.state
+        
         # Draw gradient background
         self._draw_background()
         
         # Draw board
         self.board_renderer.draw_board(self.screen)
-        self.board_renderer.draw_walls(self.screen, self.game.state.walls)
+        self.board_renderer.draw_walls(self.screen, state.iter_walls())
         
         # Draw valid moves (only when not placing wall and not AI turn)
         if not self.wall_placement_mode and not self._is_ai_turn():
             self.board_renderer.draw_valid_moves(self.screen, self.valid_moves, 
-                                                  self.game.state.current_player)
+                                                  state.current_player)
         
         # Draw wall preview
         if self.wall_placement_mode and self.wall_preview:
-            is_valid = self.game.can_place_wall(self.wall_preview)
+            is_valid = self._is_preview_valid()
             self.board_renderer.draw_wall_preview(self.screen, self.wall_preview, is_valid)
         
         # Draw pawns
-        self.board_renderer.draw_pawns(self.screen, self.game.state.current_player)
+        self.board_renderer.draw_pawns(self.screen, state.current_player)
         
         # Draw UI
         self._draw_ui()
@@ -489,14 +569,68 @@ class GameGUI:
         self.tooltip.draw(self.screen)
     
     def _draw_background(self):
-        """Draw gradient background"""
+        """Draw gradient background and the player panels' glass"""
+        if self._background is None or self._background.get_size() != (self.screen_width, self.screen_height):
+            self._background = self._render_background()
+            self._ui_background = None
+        
+        panels = (self.player1_panel, self.player2_panel)
+        if not all(panel.at_rest for panel in panels):
+            # A highlight is fading, so draw the panels over the plain background
+            self.screen.blit(self._background, (0, 0))
+            for panel in panels:
+                panel.draw(self.screen)
+            return
+        
+        key = tuple((tuple(panel.rect), panel.visible, panel.highlight, panel.highlight_color)
+                    for panel in panels)
+        if self._ui_background is None or key != self._ui_background_key:
+            self._ui_background = self._background.copy()
+            for panel in panels:
+                panel.draw(self._ui_background)
+            self._ui_background_key = key
+        self.screen.blit(self._ui_background, (0, 0))
+    
+    def _render_background(self) -> pygame.Surface:
+        """Render the gradient background for the current screen size"""
+        # Every row is a single color, so fill a one-pixel column and stretch it
+        # across the screen in one scale call instead of drawing each row full width
+        column = pygame.Surface((1, self.screen_height))
         for y in range(self.screen_height):
             progress = y / self.screen_height
             color = tuple(
                 int(COLORS.BG_PRIMARY[i] + (COLORS.BG_SECONDARY[i] - COLORS.BG_PRIMARY[i]) * progress * 0.5)
                 for i in range(3)
             )
-            pygame.draw.line(self.screen, color, (0, y), (self.screen_width, y))
+            column.set_at((0, y), color)
+        return pygame.transform.scale(column, (self.screen_width, self.screen_height)).convert()
+    
+    def _render_text(self, text: str, font_name: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Render text with one of the GUI fonts, reusing the surface for repeated strings"""
+        key = (text, font_name, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = self.fonts[font_name].render(text, True, color).convert_alpha()
+            self._text_cache[key] = surface
+        return surface
+    
+    def _render_shadowed_text(self, text: str, font_name: str,
+                              color: Tuple[int, int, int]) -> pygame.Surface:
+        """Render text over its 2px drop shadow as one premultiplied-alpha surface"""
+        key = (text, font_name, color, 'shadowed')
+        surface = self._text_cache.get(key)
+        if surface is None:
+            shadow = self._render_text(text, font_name, (0, 0, 0)).premul_alpha()
+            front = self._render_text(text, font_name, color).premul_alpha()
+            width, height = front.get_size()
+            
+            # Premultiplied blending keeps the composite exact when it is later
+            # blitted over the background, unlike a straight-alpha intermediate
+            surface = pygame.Surface((width + 2, height + 2), pygame.SRCALPHA).convert_alpha()
+            surface.blit(shadow, (2, 2), special_flags=pygame.BLEND_PREMULTIPLIED)
+            surface.blit(front, (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
+            self._text_cache[key] = surface
+        return surface
     
     def _draw_ui(self):
         """Draw all UI elements"""
@@ -522,29 +656,19 @@ class GameGUI:
         walls_bar = self.player1_walls_bar if is_player1 else self.player2_walls_bar
         
         color = COLORS.PLAYER1_PRIMARY if is_player1 else COLORS.PLAYER2_PRIMARY
-        walls = self.game.state.player1_walls if is_player1 else self.game.state.player2_walls
-        is_current = (self.game.state.current_player == Player.PLAYER1) == is_player1
-        
-        # Draw panel background
-        panel.draw(self.screen)
+        state = self.game.state
+        walls = state.player1_walls if is_player1 else state.player2_walls
+        is_current = (state.current_player == Player.PLAYER1) == is_player1
         
-        # Get panel position
+        # Get panel position (its glass is drawn with the background)
         x = panel.rect.x
         y = panel.rect.y
         width = panel.rect.width
         
         # Draw player label
-        if is_player1:
-            label = "Player 1"
-        else:
-            if self.ai:
-                difficulty = "Easy" if self.game_mode == GameMode.PVE_EASY else \
-                            "Medium" if self.game_mode == GameMode.PVE_MEDIUM else "Hard"
-                label = f"AI ({difficulty})"
-            else:
-                label = "Player 2"
+        label = "Player 1" if is_player1 else _AI_LABEL.get(self.game_mode, "Player 2")
         
-        label_surface = self.fonts['medium'].render(label, True, color)
+        label_surface = self._render_text(label, 'medium', color)
         label_rect = label_surface.get_rect(center=(x + width // 2, y + 35))
         self.screen.blit(label_surface, label_rect)
         
@@ -554,7 +678,7 @@ class GameGUI:
         
         # Draw walls remaining text
         walls_text = f"Walls: {walls}"
-        walls_surface = self.fonts['small'].render(walls_text, True, COLORS.TEXT_PRIMARY)
+        walls_surface = self._render_text(walls_text, 'small', COLORS.TEXT_PRIMARY)
         walls_rect = walls_surface.get_rect(center=(x + width // 2, y + 140))
         self.screen.blit(walls_surface, walls_rect)
         
@@ -564,7 +688,7 @@ class GameGUI:
         # Draw thinking indicator for AI
         if not is_player1 and self.ai_thinking:
             thinking_text = "Thinking..."
-            thinking_surface = self.fonts['tiny'].render(thinking_text, True, COLORS.ACCENT_CYAN)
+            thinking_surface = self._render_text(thinking_text, 'tiny', COLORS.ACCENT_CYAN)
             thinking_rect = thinking_surface.get_rect(center=(x + width // 2, y + 185))
             self.screen.blit(thinking_surface, thinking_rect)
     
@@ -572,26 +696,61 @@ class GameGUI:
                         radius: int, glow: bool):
         """Draw a pawn icon"""
         if glow:
-            # Animated glow
+            # Animated glow: the rings are pre-composited and pulse through the surface alpha
             pulse = (math.sin(self.animation_time * 3) + 1) / 2
-            for i in range(3, 0, -1):
-                glow_radius = radius + i * 4 + int(pulse * 2)
-                glow_alpha = int((30 - i * 8) * (0.8 + pulse * 0.2))
-                glow_surface = pygame.Surface((glow_radius * 2 + 10, glow_radius * 2 + 10), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surface, (*color, max(0, glow_alpha)),
-                                 (glow_radius + 5, glow_radius + 5), glow_radius)
-                self.screen.blit(glow_surface, (x - glow_radius - 5, y - glow_radius - 5))
-        
-        # Shadow
-        pygame.draw.circle(self.screen, (0, 0, 0, 40), (x + 2, y + 2), radius)
-        
-        # Main pawn
-        pygame.draw.circle(self.screen, color, (x, y), radius)
+            glow_surface = self._get_pawn_glow(color, radius, int(pulse * 2))
+            glow_surface.set_alpha(int(255 * (0.8 + pulse * 0.2)))
+            half = glow_surface.get_width() // 2
+            self.screen.blit(glow_surface, (x - half, y - half))
         
-        # Highlight
-        highlight_radius = radius // 3
-        pygame.draw.circle(self.screen, (255, 255, 255),
-                          (x - radius // 4, y - radius // 4), highlight_radius)
+        icon = self._get_pawn_icon(color, radius)
+        self.screen.blit(icon, (x - radius - 1, y - radius - 1))
+    
+    def _get_pawn_icon(self, color: Tuple[int, int, int], radius: int) -> pygame.Surface:
+        """Get the pawn icon pre-drawn into one cached, display-format surface"""
+        key = (color, radius)
+        icon = self._pawn_icon_cache.get(key)
+        if icon is None:
+            # Drawn on an opaque surface like the screen itself, with a colorkey
+            # for the corners so the circles come out exactly as before
+            size = radius * 2 + 4
+            center = radius + 1
+            icon = pygame.Surface((size, size))
+            icon.fill(_ICON_COLORKEY)
+            
+            # Shadow
+            pygame.draw.circle(icon, (0, 0, 0, 40), (center + 2, center + 2), radius)
+            
+            # Main pawn
+            pygame.draw.circle(icon, color, (center, center), radius)
+            
+            # Highlight
+            highlight_radius = radius // 3
+            pygame.draw.circle(icon, (255, 255, 255),
+                              (center - radius // 4, center - radius // 4), highlight_radius)
+            
+            icon.set_colorkey(_ICON_COLORKEY, pygame.RLEACCEL)
+            icon = icon.convert()
+            self._pawn_icon_cache[key] = icon
+        return icon
+    
+    def _get_pawn_glow(self, color: Tuple[int, int, int], radius: int, grow: int) -> pygame.Surface:
+        """Get the 3-ring pawn icon glow composited into one cached surface"""
+        key = (color, radius, grow)
+        glow_surface = self._glow_cache.get(key)
+        if glow_surface is None:
+            center = radius + 3 * 4 + grow + 5
+            glow_surface = pygame.Surface((center * 2, center * 2), pygame.SRCALPHA)
+            
+            # Each disc's alpha is the "over" composite of itself and every larger ring under it
+            coverage = 0.0
+            for i in range(3, 0, -1):
+                coverage = 1 - (1 - coverage) * (1 - (30 - i * 8) / 255)
+                pygame.draw.circle(glow_surface, (*color, int(coverage * 255)),
+                                 (center, center), radius + i * 4 + grow)
+            glow_surface = glow_surface.convert_alpha()
+            self._glow_cache[key] = glow_surface
+        return glow_surface
     
     def _draw_turn_indicator(self):
         """Draw current turn indicator"""
@@ -610,26 +769,25 @@ class GameGUI:
                 text = "Player 2's Turn"
             color = COLORS.PLAYER2_PRIMARY
         
-        # Draw with shadow
-        shadow_surface = self.fonts['medium'].render(text, True, (0, 0, 0))
-        text_surface = self.fonts['medium'].render(text, True, color)
-        
-        text_rect = text_surface.get_rect(center=(self.screen_width // 2, 40))
-        self.screen.blit(shadow_surface, (text_rect.x + 2, text_rect.y + 2))
-        self.screen.blit(text_surface, text_rect)
+        # Draw with shadow (the shadow extends the surface 2px right and down)
+        text_surface = self._render_shadowed_text(text, 'medium', color)
+        width, height = text_surface.get_size()
+        text_rect = pygame.Rect(0, 0, width - 2, height - 2)
+        text_rect.center = (self.screen_width // 2, 40)
+        self.screen.blit(text_surface, text_rect, special_flags=pygame.BLEND_PREMULTIPLIED)
     
     def _draw_wall_mode_indicator(self):
         """Draw wall placement mode indicator"""
         # Mode text
         orientation = "Horizontal" if self.wall_orientation == WallOrientation.HORIZONTAL else "Vertical"
         mode_text = f"Wall Mode: {orientation}"
-        mode_surface = self.fonts['small'].render(mode_text, True, COLORS.WALL_PLACED)
+        mode_surface = self._render_text(mode_text, 'small', COLORS.WALL_PLACED)
         mode_rect = mode_surface.get_rect(center=(self.screen_width // 2, 70))
         self.screen.blit(mode_surface, mode_rect)
         
         # Help text
         help_text = "Right-click to rotate • ESC to cancel • F11 for fullscreen"
-        help_surface = self.fonts['tiny'].render(help_text, True, COLORS.TEXT_MUTED)
+        help_surface = self._render_text(help_text, 'tiny', COLORS.TEXT_MUTED)
         help_rect = help_surface.get_rect(center=(self.screen_width // 2, self.screen_height - 30))
         self.screen.blit(help_surface, help_rect)
         
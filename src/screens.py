@@ -4,7 +4,8 @@ Handles different game screens (menu, game, game over) with transitions.
 """
 
 import pygame
-from typing import Optional, Callable
+import math
+from typing import Dict, Optional, Callable
 from abc import ABC, abstractmethod
 
 from .constants import (
@@ -102,12 +103,66 @@ class MenuScreen(Screen):
         
         # Load larger font for epic title
         self.title_font = pygame.font.Font(None, 96)
+        self.title_text = "QUORIDOR"
+        
+        # Only the title's main color and highlight alpha animate, so the
+        # other layers are rendered once
+        self._title_glow = self._render_title_glow()
+        self._title_shadow = self.title_font.render(self.title_text, True, (0, 0, 0))
+        self._title_highlight = self.title_font.render(self.title_text, True, (255, 255, 255))
+        
+        # Every title layer has a fixed size, so the blit positions are fixed too
+        center_x = self.screen_width // 2
+        title_rect = self._title_highlight.get_rect(center=(center_x, self.title_y))
+        self._title_pos = title_rect.topleft
+        self._title_highlight_pos = (title_rect.x, title_rect.y - 2)
+        self._title_shadow_pos = title_rect.move(4, 4).topleft
+        self._title_glow_pos = self._title_glow.get_rect(center=(center_x, self.title_y)).topleft
+        
+        # Decorative pawns (glow, shadow, body and highlight) by color
+        self._pawn_sprites: Dict[tuple, pygame.Surface] = {}
+        
+        # Sparkle sprites by size, faded per frame through the surface alpha
+        self._sparkle_sprites: Dict[int, pygame.Surface] = {}
+        
+        # Pre-rendered gradient background, built on first draw
+        self._background: Optional[pygame.Surface] = None
+        
+        # Static text never changes, so it is rendered once here
+        self._setup_static_text()
+    
+    def _setup_static_text(self):
+        """Render the subtitle, footer and instruction text with their positions"""
+        # Subtitle
+        subtitle_text = "Strategic Board Game"
+        self._subtitle_surface = self.fonts['medium'].render(subtitle_text, True, COLORS.TEXT_SECONDARY)
+        self._subtitle_rect = self._subtitle_surface.get_rect(center=(self.screen_width // 2, self.subtitle_y))
+        
+        # Version badge and fullscreen hint
+        version_text = "v1.0"
+        fullscreen_hint = "Press F11 for fullscreen"
+        self._footer_text = [
+            (self.fonts['small'].render(version_text, True, COLORS.TEXT_MUTED),
+             (self.screen_width - 50, self.screen_height - 30)),
+            (self.fonts['small'].render(fullscreen_hint, True, COLORS.TEXT_MUTED),
+             (15, self.screen_height - 30)),
+        ]
+        
+        # Control instructions
+        instructions = [
+            "Controls: Click to move • W for walls • Right-click to rotate • F11 for fullscreen"
+        ]
+        
+        self._instruction_text = []
+        y = self.screen_height - 60
+        for text in instructions:
+            text_surface = self.fonts['small'].render(text, True, COLORS.TEXT_MUTED)
+            text_rect = text_surface.get_rect(center=(self.screen_width // 2, y))
+            self._instruction_text.append((text_surface, text_rect))
+            y += 25
     
     def handle_event(self, event: pygame.event.Event) -> bool:
-        for button in self.buttons:
-            if button.handle_event(event):
-                return True
-        return False
+        return ModernButton.handle_group_event(self.buttons, event)
     
     def update(self, dt: float):
         self._time += dt
@@ -125,20 +180,11 @@ class MenuScreen(Screen):
         self._draw_epic_title(surface)
         
         # Draw subtitle
-        subtitle_text = "Strategic Board Game"
-        subtitle_surface = self.fonts['medium'].render(subtitle_text, True, COLORS.TEXT_SECONDARY)
-        subtitle_rect = subtitle_surface.get_rect(center=(self.screen_width // 2, self.subtitle_y))
-        surface.blit(subtitle_surface, subtitle_rect)
+        surface.blit(self._subtitle_surface, self._subtitle_rect)
         
-        # Draw version badge
-        version_text = "v1.0"
-        version_surface = self.fonts['small'].render(version_text, True, COLORS.TEXT_MUTED)
-        surface.blit(version_surface, (self.screen_width - 50, self.screen_height - 30))
-        
-        # Draw fullscreen hint
-        fullscreen_hint = "Press F11 for fullscreen"
-        hint_surface = self.fonts['small'].render(fullscreen_hint, True, COLORS.TEXT_MUTED)
-        surface.blit(hint_surface, (15, self.screen_height - 30))
+        # Draw version badge and fullscreen hint
+        for text_surface, pos in self._footer_text:
+            surface.blit(text_surface, pos)
         
         # Draw buttons
         for button in self.buttons:
@@ -149,18 +195,25 @@ class MenuScreen(Screen):
     
     def _draw_gradient_bg(self, surface: pygame.Surface):
         """Draw gradient background"""
+        if self._background is None:
+            self._background = self._render_gradient_bg()
+        surface.blit(self._background, (0, 0))
+    
+    def _render_gradient_bg(self) -> pygame.Surface:
+        """Render the gradient background once for this screen size"""
+        # Every row is a single color: fill a one-pixel column and stretch it
+        column = pygame.Surface((1, self.screen_height))
         for y in range(self.screen_height):
             progress = y / self.screen_height
             color = tuple(
                 int(COLORS.BG_PRIMARY[i] + (COLORS.BG_SECONDARY[i] - COLORS.BG_PRIMARY[i]) * progress)
                 for i in range(3)
             )
-            pygame.draw.line(surface, color, (0, y), (self.screen_width, y))
+            column.set_at((0, y), color)
+        return pygame.transform.scale(column, (self.screen_width, self.screen_height)).convert()
     
     def _draw_decorations(self, surface: pygame.Surface):
         """Draw decorative game pieces"""
-        import math
-        
         # Animated floating pawns
         offset = math.sin(self._time * 2) * 10
         
@@ -185,55 +238,49 @@ class MenuScreen(Screen):
     def _draw_decorative_pawn(self, surface: pygame.Surface, x: int, y: int,
                               color: tuple, radius: int):
         """Draw a decorative pawn"""
-        # Glow
-        for i in range(3, 0, -1):
-            glow_surface = pygame.Surface((radius * 4, radius * 4), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, (*color, 20),
-                             (radius * 2, radius * 2), radius + i * 8)
-            surface.blit(glow_surface, (x - radius * 2, y - radius * 2))
-        
-        # Shadow
-        pygame.draw.circle(surface, (0, 0, 0, 50), (x + 3, y + 3), radius)
-        
-        # Pawn
-        pygame.draw.circle(surface, color, (x, y), radius)
-        
-        # Highlight
-        pygame.draw.circle(surface, (255, 255, 255), (x - radius // 4, y - radius // 4), radius // 3)
+        pawn_surface = self._get_pawn_sprite(color, radius)
+        surface.blit(pawn_surface, (x - radius * 2, y - radius * 2),
+                     special_flags=pygame.BLEND_PREMULTIPLIED)
+    
+    def _get_pawn_sprite(self, color: tuple, radius: int) -> pygame.Surface:
+        """Get a decorative pawn pre-drawn into one premultiplied-alpha surface"""
+        key = (color, radius)
+        pawn_surface = self._pawn_sprites.get(key)
+        if pawn_surface is None:
+            center = (radius * 2, radius * 2)
+            pawn_surface = pygame.Surface((radius * 4, radius * 4), pygame.SRCALPHA)
+            
+            # Glow
+            for i in range(3, 0, -1):
+                glow_surface = pygame.Surface((radius * 4, radius * 4), pygame.SRCALPHA)
+                pygame.draw.circle(glow_surface, (*color, 20), center, radius + i * 8)
+                pawn_surface.blit(glow_surface.premul_alpha(), (0, 0),
+                                  special_flags=pygame.BLEND_PREMULTIPLIED)
+            
+            # Shadow (opaque, as it was when drawn straight onto the screen)
+            pygame.draw.circle(pawn_surface, (0, 0, 0), (center[0] + 3, center[1] + 3), radius)
+            
+            # Pawn
+            pygame.draw.circle(pawn_surface, color, center, radius)
+            
+            # Highlight
+            pygame.draw.circle(pawn_surface, (255, 255, 255),
+                               (center[0] - radius // 4, center[1] - radius // 4), radius // 3)
+            self._pawn_sprites[key] = pawn_surface
+        return pawn_surface
     
     def _draw_epic_title(self, surface: pygame.Surface):
         """Draw an epic animated title with glow effects"""
-        import math
-        
-        title_text = "QUORIDOR"
         center_x = self.screen_width // 2
         
         # Animated glow intensity
         pulse = (math.sin(self._time * 2) + 1) / 2
         
-        # Draw outer glow layers (multiple passes for soft glow)
-        glow_colors = [
-            (*COLORS.PLAYER1_PRIMARY, int(30 * pulse)),
-            (*COLORS.ACCENT_GOLD, int(50 * pulse)),
-            (*COLORS.PLAYER1_GLOW, int(40 * pulse)),
-        ]
-        
-        for i, glow_color in enumerate(glow_colors):
-            glow_offset = (3 - i) * 4
-            glow_surface = pygame.Surface((600, 120), pygame.SRCALPHA)
-            glow_text = self.title_font.render(title_text, True, glow_color)
-            glow_rect = glow_text.get_rect(center=(300, 60))
-            glow_surface.blit(glow_text, glow_rect)
-            
-            # Blur effect by drawing multiple times with offset
-            for ox in range(-glow_offset, glow_offset + 1, 2):
-                for oy in range(-glow_offset, glow_offset + 1, 2):
-                    surface.blit(glow_surface, (center_x - 300 + ox, self.title_y - 60 + oy))
+        # Draw outer glow layers
+        surface.blit(self._title_glow, self._title_glow_pos, special_flags=pygame.BLEND_PREMULTIPLIED)
         
         # Draw shadow
-        shadow_surface = self.title_font.render(title_text, True, (0, 0, 0))
-        shadow_rect = shadow_surface.get_rect(center=(center_x + 4, self.title_y + 4))
-        surface.blit(shadow_surface, shadow_rect)
+        surface.blit(self._title_shadow, self._title_shadow_pos)
         
         # Draw main title with gradient effect (simulate with multiple colored layers)
         # Gold/white gradient
@@ -242,23 +289,50 @@ class MenuScreen(Screen):
             int(215 + 40 * pulse),
             int(100 + 50 * pulse)
         )
-        title_surface = self.title_font.render(title_text, True, main_color)
-        title_rect = title_surface.get_rect(center=(center_x, self.title_y))
-        surface.blit(title_surface, title_rect)
+        title_surface = self.title_font.render(self.title_text, True, main_color)
+        surface.blit(title_surface, self._title_pos)
         
         # Draw highlight on top edge of letters
-        highlight_color = (255, 255, 255)
-        highlight_surface = self.title_font.render(title_text, True, highlight_color)
-        highlight_surface.set_alpha(int(80 + 40 * pulse))
-        surface.blit(highlight_surface, (title_rect.x, title_rect.y - 2))
+        self._title_highlight.set_alpha(int(80 + 40 * pulse))
+        surface.blit(self._title_highlight, self._title_highlight_pos)
         
         # Draw sparkle effects around title
         self._draw_sparkles(surface, center_x, self.title_y, pulse)
     
+    def _render_title_glow(self) -> pygame.Surface:
+        """Render the title's glow layers into one premultiplied-alpha surface"""
+        # font.render draws the glyphs opaque (a color's alpha is ignored),
+        # so the glow is the same every frame
+        glow_colors = [
+            COLORS.PLAYER1_PRIMARY,
+            COLORS.ACCENT_GOLD,
+            COLORS.PLAYER1_GLOW,
+        ]
+        
+        # Room for the widest blur offset on every side of the text
+        max_offset = 3 * 4
+        width, height = self.title_font.size(self.title_text)
+        glow_surface = pygame.Surface((width + max_offset * 2, height + max_offset * 2),
+                                      pygame.SRCALPHA)
+        
+        for i, glow_color in enumerate(glow_colors):
+            glow_offset = (3 - i) * 4
+            glow_text = self.title_font.render(self.title_text, True, glow_color)
+            glow_text = glow_text.convert_alpha().premul_alpha()
+            
+            # Blur effect by drawing multiple times with offset. The offsets form
+            # a grid, so smear horizontally first and then smear that row
+            # vertically: 2n blits instead of n * n, with the same coverage.
+            row = pygame.Surface((width + glow_offset * 2, height), pygame.SRCALPHA)
+            for ox in range(-glow_offset, glow_offset + 1, 2):
+                row.blit(glow_text, (glow_offset + ox, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
+            for oy in range(-glow_offset, glow_offset + 1, 2):
+                glow_surface.blit(row, (max_offset - glow_offset, max_offset + oy),
+                                  special_flags=pygame.BLEND_PREMULTIPLIED)
+        return glow_surface
+    
     def _draw_sparkles(self, surface: pygame.Surface, center_x: int, center_y: int, pulse: float):
         """Draw animated sparkle effects"""
-        import math
-        
         sparkle_positions = [
             (-180, -30), (180, -30), (-220, 10), (220, 10),
             (-150, 30), (150, 30), (0, -45)
@@ -275,32 +349,33 @@ class MenuScreen(Screen):
                 y = center_y + oy
                 
                 # Draw sparkle (small cross/star shape)
-                sparkle_surface = pygame.Surface((20, 20), pygame.SRCALPHA)
-                color = (*COLORS.ACCENT_GOLD, sparkle_alpha)
-                
-                # Cross shape
-                pygame.draw.line(sparkle_surface, color, (10, 10 - sparkle_size), (10, 10 + sparkle_size), 2)
-                pygame.draw.line(sparkle_surface, color, (10 - sparkle_size, 10), (10 + sparkle_size, 10), 2)
-                
-                # Diagonal lines for star effect
-                diag_size = sparkle_size // 2
-                pygame.draw.line(sparkle_surface, color, (10 - diag_size, 10 - diag_size), (10 + diag_size, 10 + diag_size), 1)
-                pygame.draw.line(sparkle_surface, color, (10 + diag_size, 10 - diag_size), (10 - diag_size, 10 + diag_size), 1)
-                
+                sparkle_surface = self._get_sparkle_sprite(sparkle_size)
+                sparkle_surface.set_alpha(sparkle_alpha)
                 surface.blit(sparkle_surface, (x - 10, y - 10))
     
+    def _get_sparkle_sprite(self, sparkle_size: int) -> pygame.Surface:
+        """Get the opaque sparkle sprite for a size (there are only a few sizes)"""
+        sparkle_surface = self._sparkle_sprites.get(sparkle_size)
+        if sparkle_surface is None:
+            sparkle_surface = pygame.Surface((20, 20), pygame.SRCALPHA)
+            color = COLORS.ACCENT_GOLD
+            
+            # Cross shape
+            pygame.draw.line(sparkle_surface, color, (10, 10 - sparkle_size), (10, 10 + sparkle_size), 2)
+            pygame.draw.line(sparkle_surface, color, (10 - sparkle_size, 10), (10 + sparkle_size, 10), 2)
+            
+            # Diagonal lines for star effect
+            diag_size = sparkle_size // 2
+            pygame.draw.line(sparkle_surface, color, (10 - diag_size, 10 - diag_size), (10 + diag_size, 10 + diag_size), 1)
+            pygame.draw.line(sparkle_surface, color, (10 + diag_size, 10 - diag_size), (10 - diag_size, 10 + diag_size), 1)
+            
+            self._sparkle_sprites[sparkle_size] = sparkle_surface
+        return sparkle_surface
+    
     def _draw_instructions(self, surface: pygame.Surface):
         """Draw control instructions"""
-        instructions = [
-            "Controls: Click to move • W for walls • Right-click to rotate • F11 for fullscreen"
-        ]
-        
-        y = self.screen_height - 60
-        for text in instructions:
-            text_surface = self.fonts['small'].render(text, True, COLORS.TEXT_MUTED)
-            text_rect = text_surface.get_rect(center=(self.screen_width // 2, y))
+        for text_surface, text_rect in self._instruction_text:
             surface.blit(text_surface, text_rect)
-            y += 25
 
 
 class GameOverOverlay:
@@ -323,6 +398,21 @@ class GameOverOverlay:
         center_x = self.screen_width // 2
         center_y = self.screen_height // 2
         
+        # Black dimming layer, faded in through its surface alpha
+        self._overlay_surface = pygame.Surface((self.screen_width, self.screen_height))
+        
+        # Scratch surface for the pulsing glow, refilled every frame
+        self._glow_surface = pygame.Surface((400, 100), pygame.SRCALPHA)
+        
+        # Text only fades, so it is rendered once
+        win_text = f"{self.winner} Wins!"
+        self._win_surface = self.fonts['large'].render(win_text, True, COLORS.ACCENT_GOLD)
+        self._win_rect = self._win_surface.get_rect(center=(center_x, center_y - 40))
+        
+        subtitle = "Congratulations!"
+        self._subtitle_surface = self.fonts['medium'].render(subtitle, True, COLORS.TEXT_SECONDARY)
+        self._subtitle_rect = self._subtitle_surface.get_rect(center=(center_x, center_y + 10))
+        
         self.buttons = [
             ModernButton(
                 center_x - 140, center_y + 80,
@@ -346,16 +436,12 @@ class GameOverOverlay:
         if self._fade < 0.5:
             return False
         
-        for button in self.buttons:
-            if button.handle_event(event):
-                return True
-        return False
+        return ModernButton.handle_group_event(self.buttons, event)
     
     def draw(self, surface: pygame.Surface):
         # Draw semi-transparent overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, int(180 * self._fade)))
-        surface.blit(overlay, (0, 0))
+        self._overlay_surface.set_alpha(int(180 * self._fade))
+        surface.blit(self._overlay_surface, (0, 0))
         
         if self._fade < 0.3:
             return
@@ -364,28 +450,22 @@ class GameOverOverlay:
         center_y = self.screen_height // 2
         
         # Draw winner announcement with glow
-        import math
         pulse = (math.sin(self._time * 3) + 1) / 2
         
         # Glow effect
         glow_color = (*self.winner_color, int(100 * pulse * self._fade))
-        glow_surface = pygame.Surface((400, 100), pygame.SRCALPHA)
+        glow_surface = self._glow_surface
+        glow_surface.fill((0, 0, 0, 0))
         pygame.draw.ellipse(glow_surface, glow_color, (0, 0, 400, 100))
         surface.blit(glow_surface, (center_x - 200, center_y - 80))
         
         # Winner text
-        win_text = f"{self.winner} Wins!"
-        text_surface = self.fonts['large'].render(win_text, True, COLORS.ACCENT_GOLD)
-        text_surface.set_alpha(int(255 * self._fade))
-        text_rect = text_surface.get_rect(center=(center_x, center_y - 40))
-        surface.blit(text_surface, text_rect)
+        self._win_surface.set_alpha(int(255 * self._fade))
+        surface.blit(self._win_surface, self._win_rect)
         
         # Subtitle
-        subtitle = "Congratulations!"
-        subtitle_surface = self.fonts['medium'].render(subtitle, True, COLORS.TEXT_SECONDARY)
-        subtitle_surface.set_alpha(int(255 * self._fade))
-        subtitle_rect = subtitle_surface.get_rect(center=(center_x, center_y + 10))
-        surface.blit(subtitle_surface, subtitle_rect)
+        self._subtitle_surface.set_alpha(int(255 * self._fade))
+        surface.blit(self._subtitle_surface, self._subtitle_rect)
         
         # Draw buttons
         if self._fade > 0.5:
@@ -5,10 +5,40 @@ Reusable UI components with modern styling and animations.
 
 import pygame
 import math
-from typing import Tuple, Optional, Callable, List
+from typing import Dict, Tuple, Optional, Callable, List
 from .constants import COLORS, BUTTON_BORDER_RADIUS, ANIMATION_SPEED
 
 
+def _to_display_format(surface: pygame.Surface) -> pygame.Surface:
+    """Convert a cached surface to the display's pixel format once a window exists"""
+    if pygame.display.get_surface() is not None:
+        return surface.convert_alpha()
+    return surface
+
+
+# (base, hover) colors per button style; unknown styles draw as secondary
+_BUTTON_STYLES = {
+    "primary": (COLORS.BTN_PRIMARY, COLORS.BTN_PRIMARY_HOVER),
+    "danger": (COLORS.BTN_DANGER, (200, 60, 50)),
+    "success": (COLORS.BTN_SUCCESS, (36, 180, 100)),
+    "secondary": (COLORS.BTN_SECONDARY, COLORS.BTN_SECONDARY_HOVER),
+}
+
+# How close an eased animation value has to get before it snaps to its target
+_REST_EPSILON = 1e-3
+
+
+def _ease_towards(value: float, target: float, t: float) -> float:
+    """Move value a fraction t of the way towards target, snapping to it once
+    close enough, so components at rest skip the arithmetic entirely"""
+    if value == target:
+        return value
+    value += (target - value) * t
+    if abs(target - value) < _REST_EPSILON:
+        return float(target)
+    return value
+
+
 class UIComponent:
     """Base class for all UI components"""
     
@@ -35,6 +65,12 @@ class UIComponent:
 class ModernButton(UIComponent):
     """Modern button with hover animations and glass effect"""
     
+    # Unscaled backgrounds (shadow and body) keyed by (size, color), shared
+    # by every button, since most buttons at rest look the same apart from text
+    _background_cache: Dict[Tuple, pygame.Surface] = {}
+    # Shadows for the scaled (animating) sizes, keyed by size
+    _shadow_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+    
     def __init__(self, x: int, y: int, width: int, height: int, text: str,
                  font: pygame.font.Font, callback: Optional[Callable] = None,
                  style: str = "primary", icon: Optional[str] = None):
@@ -48,11 +84,21 @@ class ModernButton(UIComponent):
         self.pressed = False
         self._hover_anim = 0.0
         self._press_anim = 0.0
+        # Rendered labels keyed by (text, color); the text is part of the key
+        # so callers can keep assigning self.text directly
+        self._text_cache: Dict[Tuple, pygame.Surface] = {}
+        # Idle look (shadow, body and label) composited into one surface,
+        # with the (size, color, text, text color) it was drawn for
+        self._idle_surface: Optional[pygame.Surface] = None
+        self._idle_key: Optional[Tuple] = None
+        # Last drawn hover border and the (size, alpha) it was drawn for
+        self._border_surface: Optional[pygame.Surface] = None
+        self._border_key: Optional[Tuple] = None
     
     def update(self, dt: float):
         # Smooth hover animation
         target_hover = 1.0 if self.hovered else 0.0
-        self._hover_anim += (target_hover - self._hover_anim) * min(1.0, dt * 12)
+        self._hover_anim = _ease_towards(self._hover_anim, target_hover, min(1.0, dt * 12))
         
         # Press animation decay
         if self._press_anim > 0:
@@ -62,26 +108,27 @@ class ModernButton(UIComponent):
         if not self.visible:
             return
         
+        # Get colors based on style
+        base_color, hover_color = _BUTTON_STYLES.get(self.style, _BUTTON_STYLES["secondary"])
+        
+        # Interpolate colors (a button at rest needs no blending)
+        if self._hover_anim == 0.0:
+            color = base_color
+        elif self._hover_anim == 1.0:
+            color = hover_color
+        else:
+            color = self._lerp_color(base_color, hover_color, self._hover_anim)
+        
+        text_color = COLORS.TEXT_PRIMARY if self.enabled else COLORS.TEXT_MUTED
+        
+        # A button at rest is one pre-composited blit at its own rect
+        if self._hover_anim == 0.0 and self._press_anim == 0:
+            screen.blit(self._get_idle_surface(color, text_color), self.rect.topleft)
+            return
+        
         # Calculate animated properties
         scale = 1.0 + self._hover_anim * 0.02 - self._press_anim * 0.05
         
-        # Get colors based on style
-        if self.style == "primary":
-            base_color = COLORS.BTN_PRIMARY
-            hover_color = COLORS.BTN_PRIMARY_HOVER
-        elif self.style == "danger":
-            base_color = COLORS.BTN_DANGER
-            hover_color = (200, 60, 50)
-        elif self.style == "success":
-            base_color = COLORS.BTN_SUCCESS
-            hover_color = (36, 180, 100)
-        else:  # secondary
-            base_color = COLORS.BTN_SECONDARY
-            hover_color = COLORS.BTN_SECONDARY_HOVER
-        
-        # Interpolate colors
-        color = self._lerp_color(base_color, hover_color, self._hover_anim)
-        
         # Calculate scaled rect
         scaled_width = int(self.rect.width * scale)
         scaled_height = int(self.rect.height * scale)
@@ -89,30 +136,26 @@ class ModernButton(UIComponent):
         scaled_y = self.rect.centery - scaled_height // 2
         scaled_rect = pygame.Rect(scaled_x, scaled_y, scaled_width, scaled_height)
         
-        # Draw shadow
-        shadow_rect = scaled_rect.copy()
-        shadow_rect.y += 4
-        shadow_surface = pygame.Surface((shadow_rect.width, shadow_rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(shadow_surface, (0, 0, 0, 40), 
-                        (0, 0, shadow_rect.width, shadow_rect.height),
-                        border_radius=BUTTON_BORDER_RADIUS)
-        screen.blit(shadow_surface, shadow_rect.topleft)
-        
-        # Draw main button
-        pygame.draw.rect(screen, color, scaled_rect, border_radius=BUTTON_BORDER_RADIUS)
+        if scaled_rect.size == self.rect.size:
+            # Draw shadow and main button from the shared cache
+            background = self._get_background(scaled_rect.size, color)
+            screen.blit(background, scaled_rect.topleft)
+        else:
+            # Draw shadow
+            shadow_surface = self._get_shadow(scaled_rect.size)
+            screen.blit(shadow_surface, (scaled_rect.x, scaled_rect.y + 4))
+            
+            # Draw main button
+            pygame.draw.rect(screen, color, scaled_rect, border_radius=BUTTON_BORDER_RADIUS)
         
         # Draw border/glow on hover
         if self._hover_anim > 0.1:
             border_alpha = int(100 * self._hover_anim)
-            border_surface = pygame.Surface((scaled_rect.width + 4, scaled_rect.height + 4), pygame.SRCALPHA)
-            pygame.draw.rect(border_surface, (*COLORS.TEXT_PRIMARY, border_alpha),
-                           (0, 0, scaled_rect.width + 4, scaled_rect.height + 4),
-                           width=2, border_radius=BUTTON_BORDER_RADIUS + 2)
+            border_surface = self._get_border(scaled_rect.size, border_alpha)
             screen.blit(border_surface, (scaled_rect.x - 2, scaled_rect.y - 2))
         
         # Draw text
-        text_color = COLORS.TEXT_PRIMARY if self.enabled else COLORS.TEXT_MUTED
-        text_surface = self.font.render(self.text, True, text_color)
+        text_surface = self._get_text_surface(text_color)
         text_rect = text_surface.get_rect(center=scaled_rect.center)
         screen.blit(text_surface, text_rect)
     
@@ -139,6 +182,92 @@ class ModernButton(UIComponent):
         
         return False
     
+    @staticmethod
+    def handle_group_event(buttons: List['ModernButton'], event: pygame.event.Event) -> bool:
+        """Handle an event for a group of buttons, return True if one consumed it.
+        Mouse motion is hit-tested against every button in one collidelist call."""
+        if event.type == pygame.MOUSEMOTION:
+            hit = pygame.Rect(event.pos, (1, 1)).collidelist([button.rect for button in buttons])
+            for i, button in enumerate(buttons):
+                if button.visible and button.enabled:
+                    button.hovered = i == hit
+            return False
+        
+        for button in buttons:
+            if button.handle_event(event):
+                return True
+        return False
+    
+    def _get_text_surface(self, text_color: Tuple[int, int, int]) -> pygame.Surface:
+        """Get the rendered label in the given color"""
+        key = (self.text, text_color)
+        text_surface = self._text_cache.get(key)
+        if text_surface is None:
+            text_surface = _to_display_format(self.font.render(self.text, True, text_color))
+            self._text_cache[key] = text_surface
+        return text_surface
+    
+    def _get_idle_surface(self, color: Tuple[int, int, int],
+                          text_color: Tuple[int, int, int]) -> pygame.Surface:
+        """Get the button at rest (shadow, body and label) as one surface"""
+        key = (self.rect.size, color, self.text, text_color)
+        if key != self._idle_key:
+            # The label sits on the opaque body, so blending it in here gives
+            # the same pixels as blending it onto the screen
+            idle = self._get_background(self.rect.size, color).copy()
+            text_surface = self._get_text_surface(text_color)
+            idle.blit(text_surface, text_surface.get_rect(center=(self.rect.width // 2,
+                                                                   self.rect.height // 2)))
+            self._idle_surface = idle
+            self._idle_key = key
+        return self._idle_surface
+    
+    @classmethod
+    def _get_background(cls, size: Tuple[int, int], color: Tuple[int, int, int]) -> pygame.Surface:
+        """Get the button shadow and body drawn into one surface (4px taller for the shadow)"""
+        key = (size, color)
+        background = cls._background_cache.get(key)
+        if background is None:
+            width, height = size
+            background = pygame.Surface((width, height + 4), pygame.SRCALPHA)
+            
+            # Shadow, then the opaque body over all but its bottom edge
+            pygame.draw.rect(background, (0, 0, 0, 40), (0, 4, width, height),
+                            border_radius=BUTTON_BORDER_RADIUS)
+            pygame.draw.rect(background, color, (0, 0, width, height),
+                            border_radius=BUTTON_BORDER_RADIUS)
+            background = _to_display_format(background)
+            cls._background_cache[key] = background
+        return background
+    
+    @classmethod
+    def _get_shadow(cls, size: Tuple[int, int]) -> pygame.Surface:
+        """Get the drop shadow for a button of the given size"""
+        shadow = cls._shadow_cache.get(size)
+        if shadow is None:
+            shadow = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.rect(shadow, (0, 0, 0, 40), (0, 0, *size),
+                            border_radius=BUTTON_BORDER_RADIUS)
+            shadow = _to_display_format(shadow)
+            cls._shadow_cache[size] = shadow
+        return shadow
+    
+    def _get_border(self, size: Tuple[int, int], alpha: int) -> pygame.Surface:
+        """Get the hover border around a button of the given size, redrawn
+        only when the size or alpha changes, i.e. while the hover animates"""
+        key = (size, alpha)
+        if key != self._border_key:
+            width, height = size[0] + 4, size[1] + 4
+            if self._border_surface is None or self._border_surface.get_size() != (width, height):
+                self._border_surface = _to_display_format(pygame.Surface((width, height), pygame.SRCALPHA))
+            else:
+                self._border_surface.fill((0, 0, 0, 0))
+            pygame.draw.rect(self._border_surface, (*COLORS.TEXT_PRIMARY, alpha),
+                            (0, 0, width, height),
+                            width=2, border_radius=BUTTON_BORDER_RADIUS + 2)
+            self._border_key = key
+        return self._border_surface
+    
     def _lerp_color(self, c1: Tuple, c2: Tuple, t: float) -> Tuple[int, int, int]:
         """Linear interpolation between two colors"""
         return tuple(int(c1[i] + (c2[i] - c1[i]) * t) for i in range(3))
@@ -155,48 +284,66 @@ class GlassPanel(UIComponent):
         self.highlight = highlight
         self.highlight_color = highlight_color
         self._glow_anim = 0.0
+        # Last drawn glass surface and the (colors, alphas, size) it shows;
+        # it is only redrawn while the highlight animates
+        self._glass_surface: Optional[pygame.Surface] = None
+        self._glass_key: Optional[Tuple] = None
     
     def set_highlight(self, active: bool, color: Optional[Tuple[int, int, int]] = None):
         self.highlight = active
         if color:
             self.highlight_color = color
     
+    @property
+    def at_rest(self) -> bool:
+        """Whether the highlight glow has finished fading in or out"""
+        return self._glow_anim == (1.0 if self.highlight else 0.0)
+    
     def update(self, dt: float):
         target = 1.0 if self.highlight else 0.0
-        self._glow_anim += (target - self._glow_anim) * min(1.0, dt * 8)
+        self._glow_anim = _ease_towards(self._glow_anim, target, min(1.0, dt * 8))
     
     def draw(self, screen: pygame.Surface):
         if not self.visible:
             return
         
-        # Create glass surface
-        glass_surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
+        glow_alpha = 0
+        if self._glow_anim > 0.1 and self.highlight_color:
+            glow_alpha = int(50 * self._glow_anim)
+        border_color = self.highlight_color if self.highlight and self.highlight_color else COLORS.TEXT_MUTED
+        border_alpha = int(100 + 155 * self._glow_anim) if self.highlight else 60
+        
+        key = (self.rect.size, self.highlight_color, glow_alpha, border_color, border_alpha)
+        if key != self._glass_key:
+            self._render_glass(glow_alpha, border_color, border_alpha)
+            self._glass_key = key
         
-        # Draw background
-        pygame.draw.rect(glass_surface, (*COLORS.BG_SECONDARY, 220),
+        screen.blit(self._glass_surface, self.rect.topleft)
+    
+    def _render_glass(self, glow_alpha: int, border_color: Tuple[int, int, int],
+                      border_alpha: int):
+        """Redraw the glass surface, reusing it while the size is unchanged"""
+        if self._glass_surface is None or self._glass_surface.get_size() != self.rect.size:
+            self._glass_surface = _to_display_format(pygame.Surface(self.rect.size, pygame.SRCALPHA))
+        else:
+            self._glass_surface.fill((0, 0, 0, 0))
+        glass_surface = self._glass_surface
+        
+        # Draw background, or the highlight glow if active (it covers exactly
+        # the same pixels, so the background would only be overwritten)
+        fill_color = (*self.highlight_color, glow_alpha) if glow_alpha else (*COLORS.BG_SECONDARY, 220)
+        pygame.draw.rect(glass_surface, fill_color,
                         (0, 0, self.rect.width, self.rect.height),
                         border_radius=self.border_radius)
         
-        # Draw highlight glow if active
-        if self._glow_anim > 0.1 and self.highlight_color:
-            glow_alpha = int(50 * self._glow_anim)
-            pygame.draw.rect(glass_surface, (*self.highlight_color, glow_alpha),
-                           (0, 0, self.rect.width, self.rect.height),
-                           border_radius=self.border_radius)
-        
         # Draw border
-        border_color = self.highlight_color if self.highlight and self.highlight_color else COLORS.TEXT_MUTED
-        border_alpha = int(100 + 155 * self._glow_anim) if self.highlight else 60
         pygame.draw.rect(glass_surface, (*border_color[:3], border_alpha),
                         (0, 0, self.rect.width, self.rect.height),
                         width=2, border_radius=self.border_radius)
         
-        # Draw top highlight line for glass effect
-        highlight_rect = pygame.Rect(10, 2, self.rect.width - 20, 1)
-        pygame.draw.rect(glass_surface, (255, 255, 255, 30), highlight_rect,
-                        border_radius=1)
-        
-        screen.blit(glass_surface, self.rect.topleft)
+        # Draw top highlight line for glass effect (a 1px tall rounded rect
+        # is just a line, so a plain fill sets the same pixels)
+        glass_surface.fill((255, 255, 255, 30), (10, 2, self.rect.width - 20, 1))
 
 
 class AnimatedText:
@@ -213,6 +360,11 @@ class AnimatedText:
         self._pulse_time = 0.0
         self.pulse = False
         self.visible = True
+        # Rendered text with the (text, font, color) it shows, and its
+        # pulse sizes keyed by size; the pulse only ever hits a few
+        self._rendered: Optional[pygame.Surface] = None
+        self._render_key: Optional[Tuple] = None
+        self._scaled: Dict[Tuple[int, int], pygame.Surface] = {}
     
     def update(self, dt: float):
         if self.pulse:
@@ -224,23 +376,33 @@ class AnimatedText:
         
         # Calculate pulse effect
         if self.pulse:
-            scale = 1.0 + math.sin(self._pulse_time) * 0.05
-            alpha = int(200 + 55 * math.sin(self._pulse_time))
+            wave = math.sin(self._pulse_time)
+            scale = 1.0 + wave * 0.05
+            alpha = int(200 + 55 * wave)
         else:
             scale = 1.0
             alpha = 255
         
         # Render text
-        text_surface = self.font.render(self.text, True, self.color)
-        
-        # Apply alpha
-        text_surface.set_alpha(alpha)
+        key = (self.text, self.font, self.color)
+        if key != self._render_key:
+            self._rendered = _to_display_format(self.font.render(self.text, True, self.color))
+            self._render_key = key
+            self._scaled.clear()
+        text_surface = self._rendered
         
         # Scale if needed
         if scale != 1.0:
             new_size = (int(text_surface.get_width() * scale),
                        int(text_surface.get_height() * scale))
-            text_surface = pygame.transform.smoothscale(text_surface, new_size)
+            scaled = self._scaled.get(new_size)
+            if scaled is None:
+                scaled = pygame.transform.smoothscale(text_surface, new_size)
+                self._scaled[new_size] = scaled
+            text_surface = scaled
+        
+        # Apply alpha
+        text_surface.set_alpha(alpha)
         
         # Position based on anchor
         text_rect = text_surface.get_rect()
@@ -264,38 +426,60 @@ class ProgressBar(UIComponent):
         self.value = max_value
         self.color = color
         self._display_value = float(max_value)
+        # All-filled and all-empty segment strips, and the
+        # (size, max_value, color) they were drawn for
+        self._full_strip: Optional[pygame.Surface] = None
+        self._empty_strip: Optional[pygame.Surface] = None
+        self._strips_key: Optional[Tuple] = None
     
     def set_value(self, value: int):
         self.value = max(0, min(value, self.max_value))
     
     def update(self, dt: float):
         # Smooth value transition
-        self._display_value += (self.value - self._display_value) * min(1.0, dt * 8)
+        self._display_value = _ease_towards(self._display_value, self.value, min(1.0, dt * 8))
     
     def draw(self, screen: pygame.Surface):
         if not self.visible:
             return
         
         segment_width = (self.rect.width - (self.max_value - 1) * 3) // self.max_value
-        
+        step = segment_width + 3
+        key = (self.rect.size, self.max_value, self.color)
+        if key != self._strips_key:
+            self._full_strip = self._render_strip(segment_width, self.color)
+            self._empty_strip = self._render_strip(segment_width, COLORS.WALL_SLOT)
+            self._strips_key = key
+        
+        # Filled segments, then the one partially filled (animating) segment
+        filled = min(self.max_value, int(self._display_value))
+        if filled:
+            screen.blit(self._full_strip, self.rect.topleft, (0, 0, filled * step, self.rect.height))
+        fill_amount = self._display_value - filled
+        if filled < self.max_value and fill_amount > 0:
+            empty_amount = 1 - fill_amount
+            r, g, b = self.color
+            slot_r, slot_g, slot_b = COLORS.WALL_SLOT
+            fill_color = (int(r * fill_amount + slot_r * empty_amount),
+                          int(g * fill_amount + slot_g * empty_amount),
+                          int(b * fill_amount + slot_b * empty_amount))
+            segment_rect = pygame.Rect(self.rect.x + filled * step, self.rect.y,
+                                       segment_width, self.rect.height)
+            pygame.draw.rect(screen, fill_color, segment_rect, border_radius=2)
+            filled += 1
+        
+        # Empty segments
+        if filled < self.max_value:
+            screen.blit(self._empty_strip, (self.rect.x + filled * step, self.rect.y),
+                        (filled * step, 0, self.rect.width - filled * step, self.rect.height))
+    
+    def _render_strip(self, segment_width: int, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Draw every segment of the bar in one color onto a transparent strip"""
+        strip = pygame.Surface(self.rect.size, pygame.SRCALPHA)
         for i in range(self.max_value):
-            segment_x = self.rect.x + i * (segment_width + 3)
-            segment_rect = pygame.Rect(segment_x, self.rect.y, segment_width, self.rect.height)
-            
-            if i < self._display_value:
-                # Filled segment
-                fill_amount = min(1.0, self._display_value - i)
-                fill_color = self.color
-                
-                if fill_amount < 1.0:
-                    # Partially filled (animating)
-                    fill_color = tuple(int(c * fill_amount + COLORS.WALL_SLOT[j] * (1 - fill_amount)) 
-                                      for j, c in enumerate(self.color))
-                
-                pygame.draw.rect(screen, fill_color, segment_rect, border_radius=2)
-            else:
-                # Empty segment
-                pygame.draw.rect(screen, COLORS.WALL_SLOT, segment_rect, border_radius=2)
+            pygame.draw.rect(strip, color, (i * (segment_width + 3), 0, segment_width, self.rect.height),
+                            border_radius=2)
+        return _to_display_format(strip)
 
 
 class Tooltip:
@@ -308,6 +492,12 @@ class Tooltip:
         self.x = 0
         self.y = 0
         self._fade = 0.0
+        # Last rendered text and background, with the text and the
+        # (size, alpha) they were drawn for
+        self._text_surface: Optional[pygame.Surface] = None
+        self._text_key: Optional[str] = None
+        self._bg_surface: Optional[pygame.Surface] = None
+        self._bg_key: Optional[Tuple] = None
     
     def show(self, text: str, x: int, y: int):
         self.text = text
@@ -320,13 +510,16 @@ class Tooltip:
     
     def update(self, dt: float):
         target = 1.0 if self.visible else 0.0
-        self._fade += (target - self._fade) * min(1.0, dt * 12)
+        self._fade = _ease_towards(self._fade, target, min(1.0, dt * 12))
     
     def draw(self, screen: pygame.Surface):
         if self._fade < 0.05:
             return
         
-        text_surface = self.font.render(self.text, True, COLORS.TEXT_PRIMARY)
+        if self.text != self._text_key:
+            self._text_surface = _to_display_format(self.font.render(self.text, True, COLORS.TEXT_PRIMARY))
+            self._text_key = self.text
+        text_surface = self._text_surface
         padding = 8
         
         bg_rect = pygame.Rect(self.x, self.y,
@@ -341,15 +534,23 @@ class Tooltip:
         
         # Draw background
         alpha = int(220 * self._fade)
-        bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(bg_surface, (*COLORS.BG_TERTIARY, alpha),
-                        (0, 0, bg_rect.width, bg_rect.height),
-                        border_radius=6)
-        pygame.draw.rect(bg_surface, (*COLORS.TEXT_MUTED, alpha),
-                        (0, 0, bg_rect.width, bg_rect.height),
-                        width=1, border_radius=6)
-        
-        screen.blit(bg_surface, bg_rect.topleft)
+        bg_key = (bg_rect.size, alpha)
+        if bg_key != self._bg_key:
+            # Redraw in place while the size is unchanged (i.e. during a fade)
+            if self._bg_surface is None or self._bg_surface.get_size() != bg_rect.size:
+                self._bg_surface = _to_display_format(pygame.Surface(bg_rect.size, pygame.SRCALPHA))
+            else:
+                self._bg_surface.fill((0, 0, 0, 0))
+            bg_surface = self._bg_surface
+            pygame.draw.rect(bg_surface, (*COLORS.BG_TERTIARY, alpha),
+                            (0, 0, bg_rect.width, bg_rect.height),
+                            border_radius=6)
+            pygame.draw.rect(bg_surface, (*COLORS.TEXT_MUTED, alpha),
+                            (0, 0, bg_rect.width, bg_rect.height),
+                            width=1, border_radius=6)
+            self._bg_key = bg_key
+        
+        screen.blit(self._bg_surface, bg_rect.topleft)
         
         # Draw text
         text_surface.set_alpha(int(255 * self._fade))
@@ -0,0 +1,44 @@
+"""
+Tests for the AI search.
+"""
+
+import unittest
+
+from src.ai import QuoridorAI
+from src.game_logic import QuoridorGame, Player, Wall, WallOrientation
+
+
+def _hard_ai(quiescence_swing: float) -> QuoridorAI:
+    """Hard AI for player 2 that always finishes its full-depth search"""
+    ai = QuoridorAI(Player.PLAYER2, "hard")
+    ai.time_budget = float('inf')
+    ai.quiescence_swing = quiescence_swing
+    return ai
+
+
+class QuiescenceExtensionTest(unittest.TestCase):
+    """The extension must reach the horizon of the full-depth search"""
+    
+    def setUp(self):
+        self.game = QuoridorGame()
+        self.assertTrue(self.game.place_wall(Wall(6, 4, WallOrientation.HORIZONTAL)))
+        self.assertTrue(self.game.move_player((0, 3)))
+        self.assertTrue(self.game.place_wall(Wall(4, 6, WallOrientation.HORIZONTAL)))
+    
+    def test_extension_changes_hard_choice(self):
+        extended = _hard_ai(2).get_best_move(self.game)
+        unextended = _hard_ai(float('inf')).get_best_move(self.game)
+        
+        # Without the extension the depth-3 search settles on a blocking wall;
+        # letting the replies to path-swinging walls play out prefers advancing
+        self.assertEqual(unextended, ("wall", Wall(7, 3, WallOrientation.VERTICAL)))
+        self.assertEqual(extended, ("move", (1, 3)))
+    
+    def test_search_leaves_game_untouched(self):
+        zobrist = self.game.state.zobrist
+        _hard_ai(2).get_best_move(self.game)
+        self.assertEqual(self.game.state.zobrist, zobrist)
+
+
+if __name__ == "__main__":
+    unittest.main()